@@ -8,6 +8,7 @@ _assets_dir = Path(__file__).resolve().parent.parent / "assets" / "edinet" / "xb
 _zip_path = _assets_dir / "annual_toyota_2023_06_30.zip"
 
 collection = Collection()
+now = datetime.now()
 
 
 print("================================================")
@@ -21,7 +22,7 @@ filing = Filing(
     name="test_name",
     is_zip=False,
     format="xbrl",
-    created_at=datetime.now(),
+    created_at=now,
 )
 
 try:
@@ -43,7 +44,7 @@ edinet_filing = EDINETFiling(
     name="test_name",
     is_zip=False,
     format="xbrl",
-    created_at=datetime.now(),
+    created_at=now,
     doc_id="test_doc_id",
     edinet_code="test_edinet_code",
     sec_code="test_sec_code",
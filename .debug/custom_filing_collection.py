@@ -2,7 +2,7 @@
 カスタム Filing クラスを register_filing_class なしで保存・取得するデバッグスクリプト。
 
 確認ポイント:
-- add 時に _filing_class へ完全修飾名が記録されること
+- add / add_many 時に _filing_class へ完全修飾名が記録されること
 - get / search 時に動的インポートで保存時の型として復元されること
 """
 
@@ -53,6 +53,24 @@ result_filing, path = collection.add(filing, content)
 print(f"[add] path: {path}")
 print(f"[add] type: {type(result_filing)}")
 
+# ========== add_many ==========
+
+many_content = b"sample filing content (batch)"
+many_filing = CustomFiling(
+    id="custom_002",
+    source="user_defined",
+    checksum=hashlib.sha256(many_content).hexdigest(),
+    name="custom_report_batch.pdf",
+    is_zip=False,
+    created_at=datetime.now(),
+    report_type="quarterly",
+    fiscal_year=2024,
+)
+
+[(many_result_filing, many_path)] = collection.add_many([(many_filing, many_content)])
+print(f"\n[add_many] path: {many_path}")
+print(f"[add_many] type: {type(many_result_filing)}")
+
 # ========== get (型の復元確認) ==========
 
 fetched_filing, fetched_content = collection.get("custom_001")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any, Optional, Type
 
@@ -25,6 +26,9 @@ _CORE_COLUMNS = (
     "data",
 )
 
+# index_batch の複数行 INSERT 1 文あたりの最大行数
+_INSERT_CHUNK_SIZE = 1000
+
 
 def _py_type_to_duckdb(py_type: Type[Any] | None) -> str:
     """Python 型を DuckDB のカラム型に変換する。"""
@@ -54,9 +58,11 @@ class Catalog:
 
     Methods:
     - index: Add Filing to the catalog
+    - index_if_absent: Add Filing to the catalog unless the ID already exists
     - index_batch: Add multiple Filing to the catalog
     - get: Get Filing from the catalog by ID
     - get_raw: Get raw dict from the catalog by ID
+    - get_raw_many: Get raw dicts from the catalog by multiple IDs in one query
     - search: Search Filing from the catalog
     - search_raw: Execute raw SQL (advanced)
     - count: Count the number of Filing in the catalog
@@ -78,6 +84,11 @@ class Catalog:
         self.db_file_path = db_file_path
         self.conn = duckdb.connect(db_file_path)
         self._resolver = resolver if resolver is not None else default_resolver
+        # (Filing クラス, カラム構成, 重複時の動作) ごとの INSERT 文と値の取り出し順のキャッシュ
+        self._insert_plan_cache: dict[
+            tuple[type[Filing], tuple[str, ...], str],
+            tuple[str, tuple[str | None, ...]],
+        ] = {}
         self._init_schema()
 
     def _init_schema(self):
@@ -121,6 +132,7 @@ class Catalog:
         """
         filings テーブルのカラム名一覧を取得
         （物理カラム＋data）。
+        同じ DB ファイルを共有する他の Catalog が追加したカラムも反映するため、毎回 information_schema を参照する。
         """
         result = self.conn.execute(
             """
@@ -133,29 +145,45 @@ class Catalog:
 
     def _ensure_indexed_columns(
         self,
-        filing_cls: Type[
+        *filing_classes: Type[
             Filing
-        ],  # filing_clsはFilingのインスタンスではなく、Filingのクラス
+        ],  # filing_classesはFilingのインスタンスではなく、Filingのクラス
     ) -> None:
         """
         Filing クラスの indexed が有効なフィールドがテーブルに物理カラムとして存在しない場合、物理カラムとインデックスを作成する
+        複数クラス分の不足カラムをまとめて算出し、1 トランザクションで追加する。
+        算出後に他の Catalog が同じカラムを追加していても失敗しないよう IF NOT EXISTS を付ける。
         """
         existing = set[str](self._get_table_column_names())
-        indexed_fields = filing_cls.get_indexed_fields()
-        fields = getattr(filing_cls, "_fields", {})
+        missing: dict[str, str] = {}
 
-        for name in indexed_fields:
-            if name in existing:
-                continue
-            field = fields.get(name)
-            py_type = getattr(field, "_field_type", None) if field else None
-            duck_type = _py_type_to_duckdb(py_type) if py_type else "VARCHAR"
-            self.conn.execute(f'ALTER TABLE filings ADD COLUMN "{name}" {duck_type}')
-            self.conn.execute(
-                f'CREATE INDEX IF NOT EXISTS idx_{name} ON filings("{name}")'
-            )
-            existing.add(name)
-        self.conn.commit()
+        for filing_cls in filing_classes:
+            fields = getattr(filing_cls, "_fields", {})
+            for name in filing_cls.get_indexed_fields():
+                if name in existing or name in missing:
+                    continue
+                field = fields.get(name)
+                py_type = getattr(field, "_field_type", None) if field else None
+                missing[name] = _py_type_to_duckdb(py_type) if py_type else "VARCHAR"
+
+        if not missing:
+            return
+
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            for name, duck_type in missing.items():
+                self.conn.execute(
+                    f'ALTER TABLE filings ADD COLUMN IF NOT EXISTS "{name}" {duck_type}'
+                )
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{name}" ON filings("{name}")'
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        # カラム構成が変わったため、旧構成の INSERT 計画は二度と使われない
+        self._insert_plan_cache.clear()
 
     def _data_only_dict(
         self,
@@ -266,6 +294,30 @@ class Catalog:
         Args:
             filing: 索引するFiling
         """
+        self._index_one(filing, on_conflict="REPLACE")
+
+    def index_if_absent(self, filing: Filing) -> bool:
+        """
+        未登録の場合のみ Filing を索引する（同一 id が既にあれば何もしない）
+
+        存在確認と登録を 1 文（INSERT OR IGNORE）で行う。
+
+        Args:
+            filing: 索引するFiling
+
+        Returns:
+            登録した場合は True、同一 id が既に存在した場合は False
+        """
+        return self._index_one(filing, on_conflict="IGNORE") > 0
+
+    def _index_one(self, filing: Filing, on_conflict: str) -> int:
+        """
+        1 件の Filing を INSERT OR {on_conflict} で索引し、登録された行数を返す
+
+        Args:
+            filing: 索引するFiling
+            on_conflict: id 重複時の動作（"REPLACE" または "IGNORE"）
+        """
         filing_dict = filing.to_dict()
 
         # Catalog で復元時にクラスを解決するため _filing_class を保存
@@ -290,41 +342,91 @@ class Catalog:
         indexed_columns = set(columns) - {"data"}
         data_only = self._data_only_dict(filing_dict, indexed_columns)
         filing_json = json_dumps(data_only)
-        indexed_set = set(type(filing).get_indexed_fields())
-
-        values: list[Any] = []
-        for col in columns:
-            if col == "data":
-                values.append(filing_json)
-            elif col in indexed_set or col in _CORE_COLUMNS:
-                values.append(filing_dict.get(col))
-            else:
-                values.append(None)
-
-        placeholders = ", ".join(["?"] * len(columns))
-        cols_str = ", ".join(f'"{c}"' for c in columns)
-        self.conn.execute(
-            f"INSERT OR REPLACE INTO filings ({cols_str}) VALUES ({placeholders})",
-            values,
-        )
+        sql, value_keys = self._insert_plan(type(filing), tuple(columns), on_conflict)
+
+        row = self.conn.execute(
+            sql, self._row_values(value_keys, filing_dict, filing_json)
+        ).fetchone()
         self.conn.commit()
+        return row[0] if row else 0
+
+    def _insert_plan(
+        self,
+        filing_cls: type[Filing],
+        columns: tuple[str, ...],
+        on_conflict: str = "REPLACE",
+    ) -> tuple[str, tuple[str | None, ...]]:
+        """
+        単一行 INSERT 文と、各カラムに入れる値のキーの組を返す。
+
+        キーは "data"（data カラムの JSON）、Filing 辞書のキー、または None（NULL）。
+        (Filing クラス, カラム構成, 重複時の動作) ごとにキャッシュし、同じ形の INSERT では組み立て直さない。
+        カラム構成が変わればキーも変わるため、ADD COLUMN 後に古い計画が使われることはない。
+
+        Args:
+            filing_cls: 索引する Filing のクラス
+            columns: filings テーブルのカラム名（テーブル上の順序）
+            on_conflict: id 重複時の動作（"REPLACE" または "IGNORE"）
+
+        Returns:
+            (INSERT 文, 値のキー)
+        """
+        key = (filing_cls, columns, on_conflict)
+        plan = self._insert_plan_cache.get(key)
+        if plan is None:
+            indexed_set = set(filing_cls.get_indexed_fields())
+            value_keys = tuple(
+                col
+                if col == "data" or col in indexed_set or col in _CORE_COLUMNS
+                else None
+                for col in columns
+            )
+            placeholders = ", ".join(["?"] * len(columns))
+            cols_str = ", ".join(f'"{c}"' for c in columns)
+            sql = (
+                f"INSERT OR {on_conflict} INTO filings ({cols_str}) "
+                f"VALUES ({placeholders})"
+            )
+            plan = (sql, value_keys)
+            self._insert_plan_cache[key] = plan
+        return plan
+
+    @staticmethod
+    def _row_values(
+        value_keys: tuple[str | None, ...],
+        filing_dict: dict[str, Any],
+        filing_json: str,
+    ) -> list[Any]:
+        """_insert_plan の値のキーに従って 1 行分の値を並べる。"""
+        return [
+            filing_json
+            if key == "data"
+            else (None if key is None else filing_dict.get(key))
+            for key in value_keys
+        ]
 
     def index_batch(self, filings: list[Filing]) -> None:
         """
         バッチ索引
 
-        各 Filing の型ごとに indexed カラムを確保してから、同一のカラム順で一括 INSERT する。
+        各 Filing の型ごとに indexed カラムを確保してから、同一のカラム順で複数行 INSERT する。
+        値は index と同じくパラメータで渡す（型変換できない値は index と同様にエラーとなる）。
+        全行を 1 トランザクションで登録する（_INSERT_CHUNK_SIZE 行ごとに 1 文）。
 
         Args:
             filings: Filing一覧
         """
-        for filing in filings:
-            self._ensure_indexed_columns(type(filing))
+        if not filings:
+            return
+
+        # 型ごとの不足カラムを先にまとめて追加する（型の出現順を維持）
+        self._ensure_indexed_columns(*dict.fromkeys(type(f) for f in filings))
 
         columns = self._get_table_column_names()
+        column_tuple = tuple(columns)
         indexed_columns = set(columns) - {"data"}
-        core_set: set[str] = {c for c in _CORE_COLUMNS if c != "data"}
-        rows: list[list[Any]] = []
+        # 同一 id は後勝ち（1 文の INSERT OR REPLACE では同じ行を 2 回更新できないため事前に集約する）
+        rows_by_id: dict[str, list[Any]] = {}
 
         for filing in filings:
             filing_dict = filing.to_dict()
@@ -333,25 +435,30 @@ class Catalog:
             )
             data_only = self._data_only_dict(filing_dict, indexed_columns)
             filing_json = json_dumps(data_only)
-            indexed_set = set(type(filing).get_indexed_fields())
+            _, value_keys = self._insert_plan(type(filing), column_tuple)
 
-            values: list[Any] = []
-            for col in columns:
-                if col == "data":
-                    values.append(filing_json)
-                elif col in indexed_set or col in core_set:
-                    values.append(filing_dict.get(col))
-                else:
-                    values.append(None)
-            rows.append(values)
-
-        placeholders = ", ".join(["?"] * len(columns))
+            rows_by_id.pop(filing.id, None)
+            rows_by_id[filing.id] = self._row_values(
+                value_keys, filing_dict, filing_json
+            )
+
+        rows = list(rows_by_id.values())
+        row_placeholders = "(" + ", ".join(["?"] * len(columns)) + ")"
         cols_str = ", ".join(f'"{c}"' for c in columns)
-        self.conn.executemany(
-            f"INSERT OR REPLACE INTO filings ({cols_str}) VALUES ({placeholders})",
-            rows,
-        )
-        self.conn.commit()
+
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+                chunk = rows[start : start + _INSERT_CHUNK_SIZE]
+                values_sql = ", ".join([row_placeholders] * len(chunk))
+                self.conn.execute(
+                    f"INSERT OR REPLACE INTO filings ({cols_str}) VALUES {values_sql}",
+                    [value for row in chunk for value in row],
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
 
     def get(self, id: str) -> Filing | None:
         """
@@ -392,6 +499,35 @@ class Catalog:
 
         return self._row_to_full_doc(columns, row)
 
+    def get_raw_many(self, ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """
+        複数 ID 一括取得（生の辞書。Filing に復元しない）
+
+        1 回のクエリで取得する。存在しない ID は結果に含まれない。
+
+        Args:
+            ids: Filing ID 一覧
+
+        Returns:
+            ID をキーとした完全なフィールド辞書
+        """
+        id_list = list(dict.fromkeys(ids))
+        if not id_list:
+            return {}
+
+        columns = self._get_table_column_names()
+        cols_str = ", ".join(f'"{c}"' for c in columns)
+        rows = self.conn.execute(
+            f"SELECT {cols_str} FROM filings WHERE id = ANY(?::VARCHAR[])",
+            [id_list],
+        ).fetchall()
+
+        result: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            doc = self._row_to_full_doc(columns, row)
+            result[doc["id"]] = doc
+        return result
+
     def search(
         self,
         expr: Expr | None | bool = None,
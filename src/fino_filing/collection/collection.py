@@ -1,5 +1,5 @@
-import hashlib
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional
 
@@ -9,10 +9,11 @@ from fino_filing.collection.error import (
 )
 from fino_filing.filing.expr import Expr
 from fino_filing.filing.filing import Filing
+from fino_filing.util.content import sha256_checksum
 
 from .catalog import Catalog
 from .locator import Locator
-from .storage import Storage
+from .storage import Storage, SupportsSaveMany
 from .storages import LocalStorage
 
 logger = logging.getLogger(__name__)
@@ -24,9 +25,11 @@ class Collection:
 
     Methods:
     - add: Add Filing to the collection
-    - get: Get Filing from the collection by ID
-    - get_filing: Get Filing from the collection by ID
+    - add_many: Add multiple Filings to the collection at once
+    - get: Get Filing, content and path from the collection by ID
+    - get_filing: Get Filing from the collection by ID (no content read)
     - get_content: Get saved file bytes by ID (e.g. for arelle parsing)
+    - get_path: Get the absolute path of the saved file by ID
     - search: Search Filing from the collection
     - clear: Remove all filings from the catalog and delete stored content files
     """
@@ -71,14 +74,7 @@ class Collection:
             tuple[Filing, str]: Filing and path
         """
         # Checksumチェック
-        actual_checksum = hashlib.sha256(content).hexdigest()
-        expected_checksum = filing.checksum
-        if actual_checksum != expected_checksum:
-            raise CollectionChecksumMismatchError(
-                filing_id=filing.id,
-                actual_checksum=actual_checksum,
-                expected_checksum=expected_checksum,
-            )
+        self._verify_checksum(filing, sha256_checksum(content))
 
         filing_id = filing.id
         # pathを生成する (Locator)
@@ -86,28 +82,92 @@ class Collection:
         if storage_key is None:
             raise LocatorPathResolutionError(filing=filing)
 
-        # Catalog重複チェック or Catalog保存
-        if self._catalog.get(filing_id) is not None:
+        # Catalog保存（既存 id は 1 文の INSERT OR IGNORE でスキップ）
+        if not self._catalog.index_if_absent(filing):
             logger.warning(
                 "Filing id: %s already exists in catalog so skip saving in catalog",
                 filing_id,
             )
-        else:
-            self._catalog.index(filing)
 
         # Storage保存
         actual_path = self._storage.save(content, storage_key=storage_key)
 
         return filing, actual_path
 
+    @staticmethod
+    def _verify_checksum(filing: Filing, actual_checksum: str) -> None:
+        """content の SHA-256 が filing.checksum と一致しなければ CollectionChecksumMismatchError"""
+        if actual_checksum != filing.checksum:
+            raise CollectionChecksumMismatchError(
+                filing_id=filing.id,
+                actual_checksum=actual_checksum,
+                expected_checksum=filing.checksum,
+            )
+
+    def add_many(
+        self, items: Iterable[tuple[Filing, bytes]]
+    ) -> list[tuple[Filing, str]]:
+        """
+        Add multiple Filings to the collection at once
+
+        Args:
+            items: Pairs of Filing and content to add
+
+        Returns:
+            list[tuple[Filing, str]]: Filing and path for each item (in input order)
+        """
+        pairs = list(items)
+
+        # Checksum / path 解決を先に全件行い、不正な要素があれば何も保存しない
+        storage_keys: list[str] = []
+        for filing, content in pairs:
+            self._verify_checksum(filing, sha256_checksum(content))
+            storage_key = self._locator.resolve(filing)
+            if storage_key is None:
+                raise LocatorPathResolutionError(filing=filing)
+            storage_keys.append(storage_key)
+
+        # Catalog保存（add と同じく Storage より先に行う。未登録の Filing のみ、1 回の index_batch にまとめる）
+        existing = self._catalog.get_raw_many(filing.id for filing, _ in pairs)
+        to_index: dict[str, Filing] = {}
+        for filing, _ in pairs:
+            if filing.id in to_index:
+                continue
+            if filing.id in existing:
+                logger.warning(
+                    "Filing id: %s already exists in catalog so skip saving in catalog",
+                    filing.id,
+                )
+                continue
+            to_index[filing.id] = filing
+        if to_index:
+            self._catalog.index_batch(list(to_index.values()))
+
+        # Storage保存（全件。一括保存に対応した Storage（SupportsSaveMany）ならまとめて渡す）
+        if isinstance(self._storage, SupportsSaveMany):
+            actual_paths = self._storage.save_many(
+                [(content, key) for (_, content), key in zip(pairs, storage_keys)]
+            )
+        else:
+            actual_paths = [
+                self._storage.save(content, storage_key=key)
+                for (_, content), key in zip(pairs, storage_keys)
+            ]
+        results = [(filing, path) for (filing, _), path in zip(pairs, actual_paths)]
+
+        return results
+
     # ========== 検索系 ==========
 
     def get(self, id: str) -> tuple[Filing | None, bytes | None, str | None]:
         """ID specified retrieval (Filing and content). 返す path は絶対パス。"""
+        # Catalog 参照・path 解決は 1 回だけ行い、content の読み込みに使い回す
         filing = self.get_filing(id)
-        content = self.get_content(id)
         path_rel = self._locator.resolve(filing)
-        path = str((self._storage.base_dir / path_rel).resolve()) if path_rel else None
+        if path_rel is None:
+            return filing, None, None
+        content = self._load_content(path_rel)
+        path = str((self._storage.base_dir / path_rel).resolve())
         return filing, content, path
 
     def get_filing(self, id: str) -> Filing | None:
@@ -122,6 +182,10 @@ class Collection:
         path = self._locator.resolve(filing)
         if path is None:
             return None
+        return self._load_content(path)
+
+    def _load_content(self, path: str) -> bytes | None:
+        """Storage から content を読み込む。ファイルが無い場合は None。"""
         try:
             return self._storage.load_by_path(path)
         except FileNotFoundError:
@@ -18,6 +18,9 @@ from fino_filing.filing.filing import Filing
 
 logger = logging.getLogger(__name__)
 
+# 解決失敗として記憶する名前の上限（超えたら古いものから忘れ、次の resolve で import を再試行する）
+_MAX_UNRESOLVED = 1024
+
 
 class FilingResolver:
     """
@@ -29,25 +32,41 @@ class FilingResolver:
 
     def __init__(self) -> None:
         self._registry: dict[str, type[Filing]] = {}
+        # 動的インポートで解決できなかった名前（search の行ごとに import を再試行しない。
+        # 挿入順を保持する dict を使い、_MAX_UNRESOLVED 件を超えたら古いものから捨てる）
+        self._unresolved: dict[str, None] = {}
 
     def register(self, cls: type[Filing]) -> None:
         """Filing サブクラスを完全修飾クラス名で登録する。"""
         name = f"{cls.__module__}.{cls.__qualname__}"
         self._registry[name] = cls
+        self._unresolved.pop(name, None)
 
     def resolve(self, name: Optional[str]) -> Optional[type[Filing]]:
         """
         完全修飾クラス名から Filing サブクラスを解決する。
 
         1. 内部レジストリを参照する
-        2. 未登録なら動的インポートを試みる
+        2. 未登録なら動的インポートを試みる（失敗した名前は記憶し、register されるか
+           上限を超えて忘れられるまで None を返す）
         3. 解決できなければ None を返す（呼び出し側で Filing にフォールバック）
         """
         if not name:
             return None
         if name in self._registry:
             return self._registry[name]
-        return self._resolve_by_import(name)
+        if name in self._unresolved:
+            return None
+        resolved = self._resolve_by_import(name)
+        if resolved is None:
+            self._remember_unresolved(name)
+        return resolved
+
+    def _remember_unresolved(self, name: str) -> None:
+        """解決できなかった名前を記憶する。上限に達していれば最も古い名前を忘れる。"""
+        if len(self._unresolved) >= _MAX_UNRESOLVED:
+            del self._unresolved[next(iter(self._unresolved))]
+        self._unresolved[name] = None
 
     def _resolve_by_import(self, name: str) -> Optional[type[Filing]]:
         """
@@ -97,3 +116,4 @@ def register_filing_class(name: str, cls: type[Filing]) -> None:
     後方互換のために残している。通常は default_resolver.register() を使うこと。
     """
     default_resolver._registry[name] = cls
+    default_resolver._unresolved.pop(name, None)
@@ -1,15 +1,15 @@
+from functools import lru_cache
+
 from fino_filing.filing.filing import Filing
 
 
-def _suffix(filing: Filing) -> str:
+@lru_cache(maxsize=256)
+def _format_suffix(format: str) -> str:
     """
-    Filing の is_zip / format から拡張子を決定する。
+    format から拡張子を決定する（サニタイズを行う）。
+    format の種類は少数のため、結果をキャッシュして add ごとの文字列検査を省く。
     """
-    # is_zip が True のときは .zip
-    if getattr(filing, "is_zip", False):
-        return ".zip"
-    # format が設定されていればそれを使用（サニタイズを行う）
-    fmt = (getattr(filing, "format", None) or "").strip().lstrip(".").lower()
+    fmt = format.strip().lstrip(".").lower()
     # 英数字以外の文字が含まれていないかどうかをチェック
     if fmt and all(c.isalnum() or c in "-_" for c in fmt):
         return f".{fmt}"
@@ -17,6 +17,17 @@ def _suffix(filing: Filing) -> str:
     return ""
 
 
+def _suffix(filing: Filing) -> str:
+    """
+    Filing の is_zip / format から拡張子を決定する。
+    """
+    # is_zip が True のときは .zip
+    if getattr(filing, "is_zip", False):
+        return ".zip"
+    # format が設定されていればそれを使用
+    return _format_suffix(getattr(filing, "format", None) or "")
+
+
 class Locator:
     """
     Locator (Filing Path Resolver<Strategy>)
@@ -1,5 +1,6 @@
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 
 def _sanitize_storage_key(storage_key: str, base_dir: Path) -> Path:
@@ -49,3 +50,21 @@ class Storage(Protocol):
         ...
 
     def delete(self, relative_path: str) -> None: ...
+
+
+@runtime_checkable
+class SupportsSaveMany(Protocol):
+    """Optional Storage extension for saving multiple contents at once"""
+
+    def save_many(self, items: Iterable[tuple[bytes, str]]) -> list[str]:
+        """
+        Save multiple contents to the storage
+        - save each content to its storage_key path (relative path)
+
+        Args:
+            items: Pairs of content and storage key (relative path)
+
+        Returns:
+            list[str]: Saved absolute paths (in input order)
+        """
+        ...
@@ -2,6 +2,7 @@
 """完全フラット構造のLocalStorage実装（path解決はLocatorに委譲）"""
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 from fino_filing.collection.storage import _sanitize_storage_key
@@ -32,6 +33,26 @@ class LocalStorage:
         full_path.write_bytes(content)
         return str(full_path)
 
+    def save_many(self, items: Iterable[tuple[bytes, str]]) -> list[str]:
+        """
+        Save multiple contents to the local storage
+        - every storage_key is validated before anything is written
+        - each parent directory is created only once
+        """
+        targets = [
+            (content, _sanitize_storage_key(storage_key, self.base_dir))
+            for content, storage_key in items
+        ]
+        created_dirs: set[Path] = set()
+        saved_paths: list[str] = []
+        for content, full_path in targets:
+            if full_path.parent not in created_dirs:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(full_path.parent)
+            full_path.write_bytes(content)
+            saved_paths.append(str(full_path))
+        return saved_paths
+
     def load_by_path(self, relative_path: str) -> bytes:
         """相対パス指定で読み込み。"""
         full_path = _sanitize_storage_key(relative_path, self.base_dir)
@@ -50,6 +50,13 @@ class Filing(metaclass=FilingMeta):
     # メタクラスで設定されるクラス変数の型アノテーション
     _fields: dict[str, Field]
     _defaults: dict[str, Any]
+    _indexed_fields: tuple[str, ...]
+    _immutable_fields: frozenset[str]
+    _immutable_defaults: frozenset[str]
+    _validation_plan: tuple[tuple[str, Field, type | None, bool, bool], ...]
+    _identifier_fields: tuple[str, ...]
+    _temporal_fields: tuple[tuple[str, type], ...]
+    _annotation_hints: dict[str, Any]
     _data: dict[str, Any]
 
     # ========== Core Fields (Descriptor) ==========
@@ -123,22 +130,30 @@ class Filing(metaclass=FilingMeta):
                 id と created_at は省略時は内部生成される。渡した場合はその値を使用する。
         """
 
-        # データストア（フラット）を初期化（__setattr__をバイパス）
-        object.__setattr__(self, "_data", {})
+        cls = self.__class__
 
-        # メタクラスで収集した _defaults を先に適用
-        for key, value in getattr(self.__class__, "_defaults", {}).items():
-            setattr(self, key, value)
+        # データストア（フラット）をメタクラスで収集した _defaults で初期化（__setattr__をバイパス）
+        # 空の状態への default 適用は immutable チェックの対象にならないため、代入を経由しない
+        data = dict(cls._defaults)
+        object.__setattr__(self, "_data", data)
 
-        # kwargs から値を設定（descriptor経由で _data に格納）
+        # kwargs から値を設定
+        # フィールドは直接 _data に格納し、immutable な default の上書き（チェックが必要）と
+        # フィールド以外の属性は従来どおり __setattr__ を経由する
+        fields = cls._fields
+        immutable_defaults = cls._immutable_defaults
         for key, value in kwargs.items():
-            setattr(self, key, value)
+            if key in fields and key not in immutable_defaults:
+                data[key] = value
+            else:
+                setattr(self, key, value)
 
         # 内部生成: created_at / id が未設定の場合のみ補完（from_dict 復元時は渡される）
-        if self._data.get("created_at") is None:
-            setattr(self, "created_at", datetime.now())
-        if self._data.get("id") is None:
-            setattr(self, "id", self._generate_id(self._data))
+        # 未設定（None）の値の補完は immutable チェックの対象にならないため、__setattr__ を経由しない
+        if data.get("created_at") is None:
+            data["created_at"] = datetime.now()
+        if data.get("id") is None:
+            data["id"] = self._generate_id(data)
 
         # validation check
         self.__validate_fields()
@@ -148,27 +163,25 @@ class Filing(metaclass=FilingMeta):
         Filingの属性代入時にimmutableチェックを行う
         """
 
-        cls = self.__class__
-        # Fieldとして定義されているかチェック
-        if hasattr(cls, "_fields") and name in cls._fields:
-            field = cls._fields[name]
-            # immutableフィールドで既に値が設定されている場合はすでに値が存在している状態のためエラー（同一値の再設定は許可）
-            if (
-                field.immutable
-                and name in self._data  # type: ignore[attr-defined]
-                and self._data[name] is not None  # type: ignore[attr-defined]
-                and self._data[name] != value  # type: ignore[attr-defined]
-            ):
+        # immutableフィールドで既に値が設定されている場合はすでに値が存在している状態のためエラー（同一値の再設定は許可）
+        if name in self._immutable_fields:
+            current_value = self._data.get(name)
+            if current_value is not None and current_value != value:
                 from fino_filing.filing.error import FieldImmutableError
 
                 raise FieldImmutableError(
                     f"Field {name!r} is immutable and cannot be overwritten",
                     field=name,
-                    current_value=self._data[name],
+                    current_value=current_value,
                     attempt_value=value,
                 )
 
-        # 通常の属性設定（Fieldの場合はdescriptor経由で_dataに格納）
+        # Field は descriptor（Field.__set__）を経由せず _data に直接格納する
+        if name in self._fields:
+            self._data[name] = value
+            return
+
+        # Field 以外の属性は通常どおり設定する
         object.__setattr__(self, name, value)
 
     @classmethod
@@ -177,12 +190,7 @@ class Filing(metaclass=FilingMeta):
         identifier=True が設定されたフィールドの値を連結して、Filing ID を決定論的に生成する。(sha256)
         (id / created_at / checksum は生成対象または可変のためID 生成に含めない)
         """
-        identifier_fields = sorted(
-            name
-            for name, field in cls._fields.items()
-            if getattr(field, "identifier", False)
-        )
-        parts = [f"{n}={serialize(data.get(n))}" for n in identifier_fields]
+        parts = [f"{n}={serialize(data.get(n))}" for n in cls._identifier_fields]
         payload = "|".join(parts)
         return hashlib.sha256(payload.encode()).hexdigest()[:32]
 
@@ -193,55 +201,50 @@ class Filing(metaclass=FilingMeta):
         （required=False で default が無くても、インスタンス時に None のままであればエラーにしない）
         必須不足時は FilingRequiredError、型不一致時は FilingValidationError を送出する。
         """
-        cls = self.__class__
-        fields: dict[str, Any] = getattr(cls, "_fields", {})
-        required_errors: list[str] = []
+        data = self._data
+        # エラーのフィールド名のみを集め、メッセージは送出時に組み立てる（正常系では文字列を作らない）
         required_fields: list[str] = []
-        type_errors: list[str] = []
-        type_fields: list[str] = []
+        # (フィールド名, エラーメッセージ)
+        type_failures: list[tuple[str, str]] = []
 
-        for attr_name, field in fields.items():
-            data_value = self._data.get(attr_name)
+        for attr_name, field, field_type, is_required, is_core in self._validation_plan:
+            data_value = data.get(attr_name)
 
-            is_required = getattr(field, "required", False)
-
-            # 必須フィールドに値が無い or None の場合
-            if is_required and data_value is None:
-                required_errors.append(
-                    f"{attr_name!r}: required field is missing or None"
-                )
-                required_fields.append(attr_name)
+            if data_value is None:
+                # 必須フィールドに値が無い or None の場合
+                if is_required:
+                    required_fields.append(attr_name)
+                # optional で値が None の場合は型チェックしない（None を許容）
                 continue
             # filingのcore fieldは空文字を許容しない
-            if attr_name in self._core_fields and data_value == "":
-                type_errors.append(f"{attr_name!r}: core field cannot be empty")
-                type_fields.append(attr_name)
+            if is_core and data_value == "":
+                type_failures.append(
+                    (attr_name, f"{attr_name!r}: core field cannot be empty")
+                )
                 continue
 
-            # 型チェック（_field_type が未注入の場合はスキップ）
-            if field._field_type is None:
+            # 型チェック（_field_type が未注入の場合はスキップ）。不一致時のみ Field でエラー内容を組み立てる
+            if field_type is None or isinstance(data_value, field_type):
                 continue
-            # optional で値が None の場合は型チェックしない（None を許容）
-            if not is_required and data_value is None:
-                continue
-
             try:
                 field.validate_value(data_value)
             except FieldValidationError as e:
-                type_errors.append(e.message)
-                type_fields.append(attr_name)
+                type_failures.append((attr_name, e.message))
 
-        if required_errors:
+        if required_fields:
             raise FilingRequiredError(
                 "Required field is missing or None",
-                errors=required_errors,
+                errors=[
+                    f"{name!r}: required field is missing or None"
+                    for name in required_fields
+                ],
                 fields=required_fields,
             )
-        if type_errors:
+        if type_failures:
             raise FilingValidationError(
                 "Filing validation failed",
-                errors=type_errors,
-                fields=type_fields,
+                errors=[message for _, message in type_failures],
+                fields=[name for name, _ in type_failures],
             )
 
     def to_dict(self) -> dict[str, Any]:
@@ -265,22 +268,17 @@ class Filing(metaclass=FilingMeta):
         """
         辞書から復元
         """
-        # datetime / date 復元: 該当型フィールドの文字列を自動変換
+        # datetime / date 復元: 該当型フィールド（FilingMeta が算出済み）の文字列を自動変換
         data_copy = data.copy()
-        fields: dict[str, Field] = getattr(cls, "_fields", {})
 
-        for field_name, field in fields.items():
-            if field_name not in data_copy or not isinstance(
-                data_copy[field_name], str
-            ):
+        for field_name, ft in cls._temporal_fields:
+            value = data_copy.get(field_name)
+            if not isinstance(value, str):
                 continue
-            ft = field._field_type
             if ft is datetime:
-                data_copy[field_name] = datetime.fromisoformat(data_copy[field_name])
-            elif ft is date:
-                data_copy[field_name] = datetime.fromisoformat(
-                    data_copy[field_name]
-                ).date()
+                data_copy[field_name] = datetime.fromisoformat(value)
+            else:
+                data_copy[field_name] = datetime.fromisoformat(value).date()
 
         return cls(**data_copy)
 
@@ -300,9 +298,9 @@ class Filing(metaclass=FilingMeta):
     @classmethod
     def get_indexed_fields(cls) -> list[str]:
         """
-        物理カラム化されるフィールド一覧
+        物理カラム化されるフィールド一覧（クラス定義時に FilingMeta が算出した値を返す）
         """
-        return [field.name for field in cls._fields.values() if field.indexed]
+        return list(cls._indexed_fields)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -313,9 +311,7 @@ class Filing(metaclass=FilingMeta):
         return self._data == getattr(other, "_data", None)
 
     def __repr__(self) -> str:
-        all_fields = self._data.keys()
-        all_fields_values = [self._data[field] for field in all_fields]
         all_fields_str = ", ".join(
-            [f"{field}={value}" for field, value in zip(all_fields, all_fields_values)]
+            [f"{field}={value}" for field, value in self._data.items()]
         )
         return f"{self.__class__.__name__}({all_fields_str})"
@@ -1,3 +1,6 @@
+import inspect
+import sys
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Annotated, Any, get_args, get_origin, get_type_hints
 
 from fino_filing.filing.field import Field
@@ -6,6 +9,31 @@ if TYPE_CHECKING:
     pass
 
 
+def _own_type_hints(klass: type) -> dict[str, Any]:
+    """
+    klass 自身が宣言した型アノテーションだけを解決する（親クラスの分は評価しない）
+
+    名前解決の順序は get_type_hints(klass) と同じ（モジュール → クラス属性 → builtins）。
+    解決できない場合は空辞書を返す。
+    """
+    annotations = inspect.get_annotations(klass)
+    if not annotations:
+        return {}
+
+    # MRO を辿らせないため、klass 自身のアノテーションだけを持つ入れ物クラスで解決する
+    holder = type(klass.__name__, (), {"__annotations__": dict(annotations)})
+    module = sys.modules.get(klass.__module__)
+    try:
+        return get_type_hints(
+            holder,
+            globalns=dict(vars(klass)),
+            localns=getattr(module, "__dict__", {}),
+            include_extras=True,
+        )
+    except Exception:
+        return {}
+
+
 class FilingMeta(type):
     """
     Model Metaclass（フィールド自動収集）
@@ -13,12 +41,30 @@ class FilingMeta(type):
     責務:
         - クラス定義時に Annotated[T, Field(...)] から Field を抽出・注入
         - _fields / _defaults に保存
+        - indexed なフィールド名を _indexed_fields に保存（Catalog の索引時に毎回走査しない）
+        - immutable なフィールド名を _immutable_fields に保存（代入のたびに Field を参照しない）
+        - default を持つ immutable なフィールド名を _immutable_defaults に保存
+        - インスタンス化時の検証手順を _validation_plan に保存（Filing.__init__ で毎回組み立てない）
+        - id 生成に使う identifier なフィールド名をソート済みで _identifier_fields に保存
+        - from_dict で復元する datetime / date 型のフィールドを _temporal_fields に保存
+        - クラス自身の型ヒントを _annotation_hints に保存（サブクラス定義時に親の分を再解決しない）
         - Descriptor protocol を有効化
 
     フィールド定義は Annotated のみ。default値はクラス属性の = 値 で指定する。
     Collectionには依存しない。
     """
 
+    # __new__ で生成したクラスに設定するクラス変数の型アノテーション
+    _fields: dict[str, Field]
+    _defaults: dict[str, Any]
+    _indexed_fields: tuple[str, ...]
+    _immutable_fields: frozenset[str]
+    _immutable_defaults: frozenset[str]
+    _validation_plan: tuple[tuple[str, Field, type | None, bool, bool], ...]
+    _identifier_fields: tuple[str, ...]
+    _temporal_fields: tuple[tuple[str, type], ...]
+    _annotation_hints: dict[str, Any]
+
     def __new__(
         # メタクラス: type[FilingMeta]
         mcs: type["FilingMeta"],
@@ -44,11 +90,15 @@ class FilingMeta(type):
         cls = super().__new__(mcs, name, bases, attrs)
 
         # 4. Annotated[T, Field(...), ...]からFieldとdefault値を抽出
-        try:
-            # クラス属性の型ヒントを取得
-            hints = get_type_hints(cls, include_extras=True)
-        except Exception:
-            hints = {}
+        # クラス属性の型ヒントを取得（get_type_hints(cls) 相当。解決済みの親クラス分は _annotation_hints を使い回す）
+        own_hints = _own_type_hints(cls)
+        cls._annotation_hints = own_hints
+        hints: dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            klass_hints = klass.__dict__.get("_annotation_hints")
+            hints.update(
+                klass_hints if klass_hints is not None else _own_type_hints(klass)
+            )
 
         for attr_name, hint in hints.items():
             # 型定義がAnnotatedとなっているか判定し、そうではないものはスキップ
@@ -165,7 +215,48 @@ class FilingMeta(type):
         for attr_name, field in fields.items():
             setattr(cls, attr_name, field)
 
-        setattr(cls, "_fields", fields)
-        setattr(cls, "_defaults", defaults)
+        cls._fields = fields
+        cls._defaults = defaults
+        cls._indexed_fields = tuple(
+            field.name for field in fields.values() if field.indexed
+        )
+
+        immutable_fields = frozenset(
+            attr_name for attr_name, field in fields.items() if field.immutable
+        )
+        cls._immutable_fields = immutable_fields
+        # default を持つ immutable フィールドのみ、インスタンス化時の上書きチェックが必要
+        cls._immutable_defaults = immutable_fields.intersection(defaults)
+
+        # 8. インスタンス化時の検証に使う (フィールド名, Field, 型, required, core field か) を固定する
+        # （__init__ のたびに Field の属性参照や _core_fields の線形探索を行わない）
+        core_field_set = frozenset(getattr(cls, "_core_fields", ()))
+        cls._validation_plan = tuple(
+            (
+                attr_name,
+                field,
+                field._field_type,
+                field.required,
+                attr_name in core_field_set,
+            )
+            for attr_name, field in fields.items()
+        )
+
+        # 9. id 生成に使う identifier=True のフィールド名をソート済みで固定する
+        cls._identifier_fields = tuple(
+            sorted(
+                attr_name
+                for attr_name, field in fields.items()
+                if getattr(field, "identifier", False)
+            )
+        )
+
+        # 10. from_dict で文字列から復元する datetime / date 型のフィールドを固定する
+        # （復元のたびに全フィールドの型を走査しない）
+        cls._temporal_fields = tuple(
+            (attr_name, field._field_type)
+            for attr_name, field in fields.items()
+            if field._field_type is datetime or field._field_type is date
+        )
 
         return cls
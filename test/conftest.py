@@ -1,6 +1,6 @@
 import hashlib
+import shutil
 import sys
-import tempfile
 from datetime import date, datetime
 from pathlib import Path
 from typing import Iterator
@@ -13,6 +13,8 @@ _test_root = Path(__file__).resolve().parent
 if str(_test_root) not in sys.path:
     sys.path.insert(0, str(_test_root))
 
+from support.memory_storage import MemoryStorage
+
 pytest_plugins = [
     "module.collector.conftest",
     "module.collector.edgar.conftest",
@@ -20,70 +22,96 @@ pytest_plugins = [
 ]
 
 
-@pytest.fixture
+# sample_content / sample_filing の content と checksum（import 時に 1 回だけ計算する）
+_SAMPLE_CONTENT = b"test content"
+_SAMPLE_CHECKSUM = hashlib.sha256(_SAMPLE_CONTENT).hexdigest()
+# sample_filing の created_at（テストごとに時刻を取得し直さず、値を固定する）
+_SAMPLE_CREATED_AT = datetime(2024, 1, 1)
+
+
+# datetime / date は不変のため、セッションで 1 回だけ取得した時刻を共有する
+@pytest.fixture(scope="session")
 def datetime_now() -> datetime:
     return datetime.now()
 
 
-@pytest.fixture
-def date_now() -> date:
-    return datetime.now().date()
+@pytest.fixture(scope="session")
+def date_now(datetime_now: datetime) -> date:
+    return datetime_now.date()
+
+
+@pytest.fixture(scope="session")
+def datetime_now_iso(datetime_now: datetime) -> str:
+    return datetime_now.isoformat()
 
 
 @pytest.fixture
 def sample_content() -> bytes:
-    return b"test content"
+    return _SAMPLE_CONTENT
 
 
 @pytest.fixture
 def sample_filing() -> tuple[Filing, bytes]:
-    """サンプル Filing と content の組。戻り値型: tuple[Filing, bytes]。"""
-    content = b"test content"
-    checksum = hashlib.sha256(content).hexdigest()
+    """
+    サンプル Filing と content の組。戻り値型: tuple[Filing, bytes]。
+    Filing は可変のためテストごとに生成し、checksum / created_at は固定値を使う。
+    """
     filing = Filing(
         id="test_id_001",
         source="test_source",
-        checksum=checksum,
+        checksum=_SAMPLE_CHECKSUM,
         name="test_filing.txt",
         is_zip=False,
         format="xbrl",
-        created_at=datetime.now(),
+        created_at=_SAMPLE_CREATED_AT,
     )
-    return filing, content
+    return filing, _SAMPLE_CONTENT
+
+
+@pytest.fixture
+def temp_work_dir(tmp_path: Path) -> Path:
+    """テストごとの一時作業ディレクトリ（pytest の tmp_path）。テストごとに必ず別のディレクトリが渡される。"""
+    return tmp_path.resolve()
+
+
+@pytest.fixture(scope="module")
+def _module_storage_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """モジュール内で共有する一時ディレクトリ（テストごとの一時ディレクトリ作成を省く）"""
+    return tmp_path_factory.mktemp("collection_test_")
 
 
 @pytest.fixture
-def temp_work_dir() -> Iterator[Path]:
-    """毎回新しい一時作業ディレクトリを作成する。テストごとに必ず別のディレクトリが渡される。"""
-    with tempfile.TemporaryDirectory(prefix="collection_test_") as tmpdir:
-        yield Path(tmpdir).resolve()
+def temp_storage(_module_storage_dir: Path) -> Iterator[LocalStorage]:
+    """
+    テスト用の一時ストレージを作成
+    ディレクトリはモジュールで共有し、テスト終了ごとに storage 配下を削除する。
+    """
+    storage = LocalStorage(_module_storage_dir / "storage")
+    yield storage
+    shutil.rmtree(storage.base_dir, ignore_errors=True)
 
 
 @pytest.fixture
-def temp_storage() -> Iterator[LocalStorage]:
-    """テスト用の一時ストレージを作成"""
-    with tempfile.TemporaryDirectory(prefix="collection_test_") as tmpdir:
-        storage = LocalStorage(Path(tmpdir) / "storage")
-        yield storage
+def mem_storage() -> MemoryStorage:
+    """
+    テスト用のインメモリストレージ（ファイルを作らない）
+    ディスク上のファイルを検証しないテストで temp_storage の代わりに使う。
+    """
+    return MemoryStorage()
 
 
 @pytest.fixture
 def temp_catalog() -> Iterator[Catalog]:
-    """テスト用の一時カタログを作成"""
-    with tempfile.TemporaryDirectory(prefix="collection_test_") as tmpdir:
-        catalog_path = Path(tmpdir) / "catalog.db"
-        catalog = Catalog(str(catalog_path))
-        yield catalog
-        catalog.close()
+    """テスト用の一時カタログを作成（インメモリ DuckDB。ファイルを作らない）"""
+    catalog = Catalog(":memory:")
+    yield catalog
+    catalog.close()
 
 
 @pytest.fixture
-def temp_collection() -> Iterator[Collection]:
-    """テスト用の一時 Collection（storage + catalog）"""
-    with tempfile.TemporaryDirectory(prefix="collection_test_") as tmpdir:
-        catalog_path = Path(tmpdir) / "index.db"
-        catalog = Catalog(str(catalog_path))
-        storage = LocalStorage(Path(tmpdir) / "storage")
-        collection = Collection(storage=storage, catalog=catalog)
-        yield collection
-        catalog.close()
+def temp_collection(temp_storage: LocalStorage, temp_catalog: Catalog) -> Collection:
+    """
+    テスト用の一時 Collection（temp_storage + temp_catalog）
+    テストごとの後始末は temp_storage / temp_catalog が行う。
+    """
+    return Collection(storage=temp_storage, catalog=temp_catalog)
@@ -1,24 +1,30 @@
-"""Catalog の単体テスト。観点: 正常系（index_batch, search, count, clear）"""
+"""Catalog の単体テスト。観点: 正常系（index_batch, index_if_absent, get_raw_many, search, count, clear, DB ファイルの共有）"""
 
 from datetime import datetime
+from pathlib import Path
+from typing import Annotated
 
+import duckdb
 import pytest
 
-from fino_filing import Catalog, Expr, Filing
+from fino_filing import Catalog, Expr, Field, Filing
+from fino_filing.collection import catalog as catalog_module
 from fino_filing.collection.error import CatalogExprTypeError
 
+# 各テストで共有する固定時刻（テストごとに時刻を取得し直さない）
+_NOW = datetime.now()
+
 
 @pytest.mark.module
 @pytest.mark.collection
 class TestCatalog_IndexBatch:
-    """Catalog.index_batch. 観点: 正常系"""
+    """Catalog.index_batch. 観点: 正常系、異常系（カラムの型に変換できない値）"""
 
     def test_index_batch_then_count(
         self,
         temp_catalog: Catalog,
     ) -> None:
         """index_batch で複数 Filing を登録し、count で件数が一致する"""
-        now = datetime.now()
         filings = [
             Filing(
                 id=f"id_{i}",
@@ -27,13 +33,280 @@ class TestCatalog_IndexBatch:
                 name="n.xbrl",
                 is_zip=False,
                 format="xbrl",
-                created_at=now,
+                created_at=_NOW,
             )
             for i in range(3)
         ]
         temp_catalog.index_batch(filings)
         assert temp_catalog.count() == 3
 
+    def test_index_batch_over_chunk_size(
+        self,
+        temp_catalog: Catalog,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """1 文あたりの行数上限を超える件数でも、複数文に分割されて全件登録される"""
+        monkeypatch.setattr(catalog_module, "_INSERT_CHUNK_SIZE", 2)
+        filings = [
+            Filing(
+                id=f"chunk_{i}",
+                source="src",
+                checksum="c" * 64,
+                name="n.xbrl",
+                is_zip=False,
+                format="xbrl",
+                created_at=_NOW,
+            )
+            for i in range(5)
+        ]
+        temp_catalog.index_batch(filings)
+        assert temp_catalog.count() == 5
+
+    def test_index_batch_duplicate_id_last_wins(
+        self,
+        temp_catalog: Catalog,
+    ) -> None:
+        """同一 id が複数含まれる場合は後ろの Filing で登録される（既存行も置き換える）"""
+        temp_catalog.index(
+            Filing(
+                id="dup",
+                source="src",
+                checksum="a" * 64,
+                name="n.xbrl",
+                is_zip=False,
+                format="xbrl",
+                created_at=_NOW,
+            )
+        )
+        filings = [
+            Filing(
+                id="dup",
+                source="src",
+                checksum=checksum * 64,
+                name="n.xbrl",
+                is_zip=False,
+                format="xbrl",
+                created_at=_NOW,
+            )
+            for checksum in ("b", "c")
+        ]
+        temp_catalog.index_batch(filings)
+
+        assert temp_catalog.count() == 1
+        restored = temp_catalog.get("dup")
+        assert restored is not None
+        assert restored.checksum == "c" * 64
+
+    def test_index_batch_stores_same_row_as_index(
+        self,
+        temp_catalog: Catalog,
+    ) -> None:
+        """index_batch で登録した行は index で登録した行と同じ値で復元される（型変換・引用符・非 ASCII・NULL を含む）"""
+
+        class TypedFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+            fiscal_year: Annotated[int, Field(indexed=True, description="Year")]
+            revenue: Annotated[float, Field(indexed=True, description="Revenue")]
+            listed: Annotated[bool, Field(indexed=True, description="Listed")]
+            submitted_at: Annotated[
+                datetime, Field(indexed=True, description="Submitted")
+            ]
+            memo: Annotated[str, Field(description="Memo")]
+
+        def _make(id: str) -> TypedFiling:
+            return TypedFiling(
+                id=id,
+                source="src",
+                checksum="c" * 64,
+                name='it\'s "quoted".xbrl',
+                is_zip=True,
+                format="xbrl",
+                created_at=_NOW,
+                ticker=None,
+                fiscal_year=2024,
+                revenue=1.5,
+                listed=False,
+                submitted_at=_NOW,
+                memo="日本語メモ",
+            )
+
+        temp_catalog.index(_make("single"))
+        temp_catalog.index_batch([_make("batch")])
+
+        single = temp_catalog.get_raw("single")
+        batch = temp_catalog.get_raw("batch")
+        assert single is not None and batch is not None
+        single.pop("id")
+        batch.pop("id")
+        assert batch == single
+        assert batch["memo"] == "日本語メモ"
+
+    def test_index_batch_stores_same_non_scalar_values_as_index(
+        self,
+        temp_catalog: Catalog,
+    ) -> None:
+        """indexed な list / dict フィールドも index で登録した行と同じ値で保存される"""
+
+        class CollectionValueFiling(Filing):
+            tags: Annotated[list, Field(indexed=True, description="Tags")]
+            attrs: Annotated[dict, Field(indexed=True, description="Attributes")]
+
+        def _make(id: str) -> CollectionValueFiling:
+            return CollectionValueFiling(
+                id=id,
+                source="src",
+                checksum="c" * 64,
+                name="n.xbrl",
+                is_zip=False,
+                format="xbrl",
+                created_at=_NOW,
+                tags=["a", "b"],
+                attrs={"k": "v"},
+            )
+
+        temp_catalog.index(_make("single"))
+        temp_catalog.index_batch([_make("batch"), _make("batch_2")])
+
+        single = temp_catalog.get_raw("single")
+        batch = temp_catalog.get_raw("batch")
+        assert single is not None and batch is not None
+        single.pop("id")
+        batch.pop("id")
+        assert batch == single
+        assert temp_catalog.count() == 3
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            # BIGINT カラムに数値に変換できない文字列
+            "E12345",
+            # BIGINT の範囲を超える整数
+            2**70,
+        ],
+        ids=["non_numeric_str", "out_of_range_int"],
+    )
+    def test_index_batch_unconvertible_value_raises(
+        self,
+        temp_catalog: Catalog,
+        code: object,
+    ) -> None:
+        """カラムの型に変換できない値は index と同様にエラーとなり、NULL として登録されない"""
+
+        class YearCodeFiling(Filing):
+            code: Annotated[int, Field(indexed=True, description="Code")]
+
+        class TextCodeFiling(Filing):
+            code: Annotated[object, Field(indexed=True, description="Code")]
+
+        # code カラムは先に登録した YearCodeFiling の型（BIGINT）で作られる
+        temp_catalog.index(
+            YearCodeFiling(
+                id="year",
+                source="src",
+                checksum="c" * 64,
+                name="n.xbrl",
+                is_zip=False,
+                format="xbrl",
+                created_at=_NOW,
+                code=2024,
+            )
+        )
+        mismatched = TextCodeFiling(
+            id="text",
+            source="src",
+            checksum="c" * 64,
+            name="n.xbrl",
+            is_zip=False,
+            format="xbrl",
+            created_at=_NOW,
+            code=code,
+        )
+
+        with pytest.raises(duckdb.ConversionException):
+            temp_catalog.index_batch([mismatched])
+
+        assert temp_catalog.get_raw("text") is None
+        assert temp_catalog.count() == 1
+
+    def test_index_batch_empty_is_noop(self, temp_catalog: Catalog) -> None:
+        """空リストでは何も登録しない"""
+        temp_catalog.index_batch([])
+        assert temp_catalog.count() == 0
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCatalog_IndexIfAbsent:
+    """Catalog.index_if_absent. 観点: 正常系、契約（既存 id は置き換えない）"""
+
+    def test_index_if_absent_inserts_then_skips_existing(
+        self,
+        temp_catalog: Catalog,
+    ) -> None:
+        """未登録なら登録して True、同一 id が既にあれば既存行を残して False を返す"""
+        first = Filing(
+            id="absent",
+            source="src",
+            checksum="a" * 64,
+            name="n.xbrl",
+            is_zip=False,
+            format="xbrl",
+            created_at=_NOW,
+        )
+        second = Filing(
+            id="absent",
+            source="src",
+            checksum="b" * 64,
+            name="n.xbrl",
+            is_zip=False,
+            format="xbrl",
+            created_at=_NOW,
+        )
+
+        assert temp_catalog.index_if_absent(first) is True
+        assert temp_catalog.index_if_absent(second) is False
+
+        assert temp_catalog.count() == 1
+        restored = temp_catalog.get("absent")
+        assert restored is not None
+        assert restored.checksum == "a" * 64
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCatalog_GetRawMany:
+    """Catalog.get_raw_many. 観点: 正常系、境界（存在しない id・空入力）"""
+
+    def test_get_raw_many_returns_found_ids(
+        self,
+        temp_catalog: Catalog,
+    ) -> None:
+        """存在する id のみ get_raw と同じ辞書で返し、存在しない id は含めない"""
+        temp_catalog.index_batch(
+            [
+                Filing(
+                    id=f"many_{i}",
+                    source="src",
+                    checksum="c" * 64,
+                    name="n.xbrl",
+                    is_zip=False,
+                    format="xbrl",
+                    created_at=_NOW,
+                )
+                for i in range(3)
+            ]
+        )
+
+        raws = temp_catalog.get_raw_many(["many_2", "missing", "many_0", "many_2"])
+
+        assert set(raws) == {"many_0", "many_2"}
+        assert raws["many_0"] == temp_catalog.get_raw("many_0")
+        assert raws["many_2"] == temp_catalog.get_raw("many_2")
+
+    def test_get_raw_many_empty(self, temp_catalog: Catalog) -> None:
+        """空の入力では空の辞書を返す"""
+        assert temp_catalog.get_raw_many([]) == {}
+
 
 @pytest.mark.module
 @pytest.mark.collection
@@ -54,7 +327,6 @@ class TestCatalog_Search:
         temp_catalog: Catalog,
     ) -> None:
         """search の limit / offset が効く"""
-        now = datetime.now()
         for i in range(5):
             temp_catalog.index(
                 Filing(
@@ -64,7 +336,7 @@ class TestCatalog_Search:
                     name="n.xbrl",
                     is_zip=False,
                     format="xbrl",
-                    created_at=now,
+                    created_at=_NOW,
                 )
             )
         all_results = temp_catalog.search(limit=10, offset=0)
@@ -85,7 +357,6 @@ class TestCatalog_Count:
         temp_catalog: Catalog,
     ) -> None:
         """expr なしで count すると全件数"""
-        now = datetime.now()
         temp_catalog.index(
             Filing(
                 id="only",
@@ -94,7 +365,7 @@ class TestCatalog_Count:
                 name="n.xbrl",
                 is_zip=False,
                 format="xbrl",
-                created_at=now,
+                created_at=_NOW,
             )
         )
         assert temp_catalog.count() == 1
@@ -113,7 +384,6 @@ class TestCatalog_Count:
         temp_catalog: Catalog,
     ) -> None:
         """expr を渡すと条件に一致する件数"""
-        now = datetime.now()
         temp_catalog.index(
             Filing(
                 id="a1",
@@ -122,7 +392,7 @@ class TestCatalog_Count:
                 name="n.xbrl",
                 is_zip=False,
                 format="xbrl",
-                created_at=now,
+                created_at=_NOW,
             )
         )
         temp_catalog.index(
@@ -133,7 +403,7 @@ class TestCatalog_Count:
                 name="n.xbrl",
                 is_zip=False,
                 format="xbrl",
-                created_at=now,
+                created_at=_NOW,
             )
         )
         expr = Expr("source = ?", ["s1"])
@@ -150,7 +420,6 @@ class TestCatalog_Clear:
         temp_catalog: Catalog,
     ) -> None:
         """clear 後に count が 0 になる"""
-        now = datetime.now()
         temp_catalog.index(
             Filing(
                 id="x",
@@ -159,9 +428,57 @@ class TestCatalog_Clear:
                 name="n.xbrl",
                 is_zip=False,
                 format="xbrl",
-                created_at=now,
+                created_at=_NOW,
             )
         )
         assert temp_catalog.count() == 1
         temp_catalog.clear()
         assert temp_catalog.count() == 0
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCatalog_SharedDatabase:
+    """同じ DB ファイルを共有する複数の Catalog. 観点: 正常系（他インスタンスの書き込み・カラム追加が反映される）"""
+
+    def test_two_catalogs_see_each_other_writes(self, tmp_path: Path) -> None:
+        """一方が追加した indexed カラムと書き込んだ行を、もう一方の get / index がそのまま扱える"""
+
+        class TickerFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+
+        def ticker_filing(id: str, name: str) -> TickerFiling:
+            return TickerFiling(
+                id=id,
+                source="src",
+                checksum="c" * 64,
+                name=name,
+                is_zip=False,
+                format="xbrl",
+                created_at=_NOW,
+                ticker="T",
+            )
+
+        db_file_path = str(tmp_path / "index.db")
+        catalog_a = Catalog(db_file_path)
+        catalog_b = Catalog(db_file_path)
+        try:
+            # catalog_b がカラム追加前のテーブルを参照した後に、catalog_a が ticker カラムを追加する
+            assert catalog_b.get_raw("shared") is None
+            catalog_a.index(ticker_filing("shared", "n"))
+
+            raw = catalog_b.get_raw("shared")
+            assert raw is not None
+            assert raw["ticker"] == "T"
+
+            catalog_b.index(ticker_filing("other", "n"))
+            assert catalog_a.count() == 2
+
+            # catalog_a で置き換えた行を catalog_b が読み直す
+            catalog_a.index(ticker_filing("shared", "n2"))
+            restored = catalog_b.get("shared")
+            assert restored is not None
+            assert restored.name == "n2"
+        finally:
+            catalog_a.close()
+            catalog_b.close()
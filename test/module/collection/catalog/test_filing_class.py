@@ -10,6 +10,7 @@ Catalog の _filing_class 振る舞いのテスト。
 import hashlib
 import json
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -17,11 +18,15 @@ import pytest
 from fino_filing import Catalog, EDINETFiling, Expr, Field, Filing
 from fino_filing.collection.filing_resolver import FilingResolver
 
+# 各テストで共有する固定時刻（テストごとに時刻を取得し直さない）
+_NOW = datetime.now()
+
+# 各テストで使う content の checksum（import 時に 1 回だけ計算する）
+_CHECKSUM = hashlib.sha256(b"dummy").hexdigest()
+
 
 def _index_filing(catalog: Catalog, filing: Filing) -> None:
-    content = b"dummy"
-    checksum = hashlib.sha256(content).hexdigest()
-    if filing.checksum != checksum:
+    if filing.checksum != _CHECKSUM:
         return
     catalog.index(filing)
 
@@ -37,16 +42,14 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """Filing を index した場合、get_raw の辞書に _filing_class が含まれる（Filing の完全修飾名）"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         filing = Filing(
             id="fc_base_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -59,16 +62,13 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """EDINETFiling を index した場合、get_raw の辞書に _filing_class が EDINETFiling の完全修飾名で含まれる"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
-        now = datetime.now()
         filing = EDINETFiling(
             id="fc_edinet_001",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=now,
+            created_at=_NOW,
             doc_id="doc1",
             edinet_code="E12345",
             sec_code="12345",
@@ -78,9 +78,9 @@ class TestCatalog_FilingClass_Behavior:
             form_code="030101",
             doc_type_code="120",
             doc_description="有価証券報告書",
-            period_start=now,
-            period_end=now,
-            submit_datetime=now,
+            period_start=_NOW,
+            period_end=_NOW,
+            submit_datetime=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -94,17 +94,13 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """default_resolver が EDINETFiling を登録しているため、get で EDINETFiling として復元される"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
-        now_dt = datetime.now()
-        today = now_dt.date()
         filing = EDINETFiling(
             id="fc_get_edinet_001",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=now_dt,
+            created_at=_NOW,
             doc_id="doc1",
             edinet_code="E12345",
             sec_code="12345",
@@ -114,9 +110,9 @@ class TestCatalog_FilingClass_Behavior:
             form_code="030101",
             doc_type_code="120",
             doc_description="有価証券報告書",
-            period_start=today,
-            period_end=today,
-            submit_datetime=now_dt,
+            period_start=_NOW.date(),
+            period_end=_NOW.date(),
+            submit_datetime=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -130,16 +126,14 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """Filing として index した場合は get で Filing として復元される"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         filing = Filing(
             id="fc_get_base_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -149,7 +143,7 @@ class TestCatalog_FilingClass_Behavior:
         assert restored.id == "fc_get_base_001"
 
     def test_get_returns_filing_fallback_when_resolver_unknown(
-        self, temp_catalog: Catalog
+        self, tmp_path: Path
     ) -> None:
         """_filing_class が resolver で解決できない場合、Filing にフォールバックする"""
 
@@ -159,16 +153,13 @@ class TestCatalog_FilingClass_Behavior:
             def resolve(self, name):  # type: ignore[no-untyped-def]
                 return self._registry.get(name) if name else None
 
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
-        now = datetime.now()
         edinet_filing = EDINETFiling(
             id="fc_fallback_001",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=now,
+            created_at=_NOW,
             doc_id="d1",
             edinet_code="E1",
             sec_code="1",
@@ -178,13 +169,15 @@ class TestCatalog_FilingClass_Behavior:
             form_code="030101",
             doc_type_code="120",
             doc_description="d",
-            period_start=now,
-            period_end=now,
-            submit_datetime=now,
+            period_start=_NOW,
+            period_end=_NOW,
+            submit_datetime=_NOW,
         )
-        temp_catalog.index(edinet_filing)
-        catalog_path = temp_catalog.db_file_path
-        temp_catalog.close()
+        # 別インスタンスで開き直すため、この検証のみファイルに永続化するカタログを使う
+        catalog_path = str(tmp_path / "catalog.db")
+        writer = Catalog(catalog_path)
+        writer.index(edinet_filing)
+        writer.close()
 
         resolver = RegistryOnlyResolver()
         catalog = Catalog(catalog_path, resolver=resolver)
@@ -201,16 +194,14 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """_filing_class が物理カラムとしてテーブルに存在し、SELECT で取得できる"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         filing = Filing(
             id="fc_phys_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -224,16 +215,14 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """data カラムには core / _filing_class を保存せず、追加フィールドのみ保存される"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         filing = Filing(
             id="fc_data_only_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -259,16 +248,13 @@ class TestCatalog_FilingClass_Behavior:
         self, temp_catalog: Catalog
     ) -> None:
         """EDINETFiling では data に追加フィールド（indexed でないもの）のみ入る想定；core と _filing_class は入らない"""
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
-        now = datetime.now()
         filing = EDINETFiling(
             id="fc_data_edinet_001",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=now,
+            created_at=_NOW,
             doc_id="d1",
             edinet_code="E1",
             sec_code="1",
@@ -278,9 +264,9 @@ class TestCatalog_FilingClass_Behavior:
             form_code="030101",
             doc_type_code="120",
             doc_description="d",
-            period_start=now,
-            period_end=now,
-            submit_datetime=now,
+            period_start=_NOW,
+            period_end=_NOW,
+            submit_datetime=_NOW,
         )
         temp_catalog.index(filing)
 
@@ -443,7 +429,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
     """
 
     def test_returns_edinet_filing_when_filing_class_resolved(
-        self, temp_catalog: Catalog, datetime_now: datetime
+        self, temp_catalog: Catalog, datetime_now_iso: str
     ) -> None:
         """_filing_class が resolver で解決できる場合、そのクラスで復元される"""
         data: dict[str, Any] = {
@@ -454,7 +440,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
             "name": "f.txt",
             "is_zip": False,
             "format": "xbrl",
-            "created_at": datetime_now.isoformat(),
+            "created_at": datetime_now_iso,
             "doc_id": "doc1",
             "edinet_code": "E12345",
             "sec_code": "12345",
@@ -464,9 +450,9 @@ class TestCatalog_Helper_resolve_data_to_filing:
             "form_code": "030101",
             "doc_type_code": "120",
             "doc_description": "有価証券報告書",
-            "period_start": datetime_now.isoformat(),
-            "period_end": datetime_now.isoformat(),
-            "submit_datetime": datetime_now.isoformat(),
+            "period_start": datetime_now_iso,
+            "period_end": datetime_now_iso,
+            "submit_datetime": datetime_now_iso,
         }
         restored = temp_catalog._resolve_data_to_filing(data)
         assert isinstance(restored, EDINETFiling)
@@ -475,7 +461,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
         assert restored.filer_name == "Test Inc."
 
     def test_returns_filing_fallback_when_no_filing_class(
-        self, temp_catalog: Catalog, datetime_now: datetime
+        self, temp_catalog: Catalog, datetime_now_iso: str
     ) -> None:
         """_filing_class が無い場合、Filing で復元される"""
         data: dict[str, Any] = {
@@ -485,7 +471,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
             "name": "f.txt",
             "is_zip": False,
             "format": "xbrl",
-            "created_at": datetime_now.isoformat(),
+            "created_at": datetime_now_iso,
         }
         restored = temp_catalog._resolve_data_to_filing(data)
         assert type(restored).__name__ == "Filing"
@@ -493,7 +479,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
         assert restored.source == "test"
 
     def test_returns_filing_fallback_when_resolver_returns_none(
-        self, temp_catalog: Catalog, datetime_now: datetime
+        self, datetime_now_iso: str
     ) -> None:
         """_filing_class が resolver で解決できない場合、Filing にフォールバックする"""
         from fino_filing.collection.filing_resolver import FilingResolver
@@ -502,11 +488,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
             def resolve(self, name):  # type: ignore[no-untyped-def]
                 return None
 
-        # temp_catalogの一時ディレクトリだけ使うため
-        catalog_path = temp_catalog.db_file_path
-        temp_catalog.close()
-
-        catalog = Catalog(catalog_path, resolver=NoResolveResolver())
+        catalog = Catalog(":memory:", resolver=NoResolveResolver())
 
         data: dict[str, Any] = {
             "_filing_class": "unknown.module.UnknownFiling",
@@ -516,7 +498,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
             "name": "f.txt",
             "is_zip": False,
             "format": "xbrl",
-            "created_at": datetime_now.isoformat(),
+            "created_at": datetime_now_iso,
         }
         restored = catalog._resolve_data_to_filing(data)
         assert type(restored).__name__ == "Filing"
@@ -524,7 +506,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
         catalog.close()
 
     def test_filing_class_removed_from_data_passed_to_from_dict(
-        self, temp_catalog: Catalog, datetime_now: datetime
+        self, temp_catalog: Catalog, datetime_now_iso: str
     ) -> None:
         """from_dict に渡す辞書には _filing_class が含まれない（pop で削除される）"""
         data: dict[str, Any] = {
@@ -535,14 +517,14 @@ class TestCatalog_Helper_resolve_data_to_filing:
             "name": "f.txt",
             "is_zip": False,
             "format": "xbrl",
-            "created_at": datetime_now.isoformat(),
+            "created_at": datetime_now_iso,
         }
         restored = temp_catalog._resolve_data_to_filing(data)
         assert restored.id == "r_pop_001"
         assert not hasattr(restored, "_filing_class")
 
     def test_original_data_unchanged(
-        self, temp_catalog: Catalog, datetime_now: datetime
+        self, temp_catalog: Catalog, datetime_now_iso: str
     ) -> None:
         """呼び出し元の data 辞書は変更されない（内部でコピーしている）"""
         data: dict[str, Any] = {
@@ -553,7 +535,7 @@ class TestCatalog_Helper_resolve_data_to_filing:
             "name": "f.txt",
             "is_zip": False,
             "format": "xbrl",
-            "created_at": datetime_now.isoformat(),
+            "created_at": datetime_now_iso,
         }
         temp_catalog._resolve_data_to_filing(data)
         assert "_filing_class" in data
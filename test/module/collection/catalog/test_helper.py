@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from pathlib import Path
 from typing import Annotated
 
 import pytest
@@ -55,6 +56,100 @@ class TestCatalog_Helper_ensure_indexed_columns:
         final_columns = temp_catalog._get_table_column_names()
         assert "ticker" in final_columns
 
+    def test_ensure_indexed_columns_multiple_classes(
+        self, temp_catalog: Catalog
+    ) -> None:
+        """複数の Filing クラスを渡すと、重複を除いた不足カラムがまとめて追加される"""
+
+        class TickerFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+            fiscal_year: Annotated[int, Field(indexed=True, description="Year")]
+
+        class YearFiling(Filing):
+            fiscal_year: Annotated[int, Field(indexed=True, description="Year")]
+            revenue: Annotated[float, Field(indexed=True, description="Revenue")]
+
+        temp_catalog._ensure_indexed_columns(TickerFiling, YearFiling)
+
+        column_names = temp_catalog._get_table_column_names()
+        assert column_names[-3:] == ["ticker", "fiscal_year", "revenue"]
+
+        actual_columns = [
+            row[0]
+            for row in temp_catalog.conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = 'filings' ORDER BY ordinal_position"
+            ).fetchall()
+        ]
+        assert actual_columns == column_names
+
+    def test_ensure_indexed_columns_already_added_by_other_catalog(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """不足判定の後に同じ DB ファイルを共有する他の Catalog がカラムを追加していても失敗しない"""
+
+        class TickerFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+
+        db_file_path = str(tmp_path / "index.db")
+        catalog_a = Catalog(db_file_path)
+        catalog_b = Catalog(db_file_path)
+        try:
+            stale_columns = catalog_b._get_table_column_names()
+            catalog_a._ensure_indexed_columns(TickerFiling)
+
+            # catalog_b は ticker 追加前のカラム一覧で不足判定する
+            monkeypatch.setattr(
+                catalog_b, "_get_table_column_names", lambda: list(stale_columns)
+            )
+            catalog_b._ensure_indexed_columns(TickerFiling)
+        finally:
+            catalog_a.close()
+            catalog_b.close()
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCatalog_Helper_insert_plan:
+    """
+    Catalog._insert_plan のテスト
+    - (Filing クラス, カラム構成) ごとに INSERT 文と値のキーをキャッシュする
+    - ADD COLUMN でカラム構成が変わるとキャッシュは破棄される
+    """
+
+    def test_insert_plan_is_cached_per_class_and_columns(
+        self, temp_catalog: Catalog
+    ) -> None:
+        """同じクラス・カラム構成では同一の計画を返し、未 indexed の拡張カラムは None（NULL）になる"""
+
+        class TickerFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+
+        temp_catalog._ensure_indexed_columns(TickerFiling)
+        columns = tuple(temp_catalog._get_table_column_names())
+
+        plan = temp_catalog._insert_plan(TickerFiling, columns)
+        assert temp_catalog._insert_plan(TickerFiling, columns) is plan
+        assert plan[1][-1] == "ticker"
+
+        # 基底 Filing は ticker を持たないため NULL を入れる
+        _, base_keys = temp_catalog._insert_plan(Filing, columns)
+        assert base_keys[-1] is None
+        assert len(temp_catalog._insert_plan_cache) == 2
+
+    def test_insert_plan_cache_cleared_on_add_column(
+        self, temp_catalog: Catalog
+    ) -> None:
+        """不足カラムの追加でキャッシュが破棄される"""
+        columns = tuple(temp_catalog._get_table_column_names())
+        temp_catalog._insert_plan(Filing, columns)
+
+        class TickerFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+
+        temp_catalog._ensure_indexed_columns(TickerFiling)
+        assert temp_catalog._insert_plan_cache == {}
+
 
 @pytest.mark.module
 @pytest.mark.collection
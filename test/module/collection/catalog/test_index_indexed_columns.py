@@ -15,17 +15,22 @@ import pytest
 
 from fino_filing import Catalog, EdgarCompanyFactsFiling, Field, Filing
 
+# 各テストで共有する固定時刻（テストごとに時刻を取得し直さない）
+_NOW = datetime.now()
+
+# 各テストで使う checksum（Catalog は content を検証しないため共通の値を import 時に 1 回だけ計算する）
+_CHECKSUM = hashlib.sha256(b"dummy").hexdigest()
+
+
+# 実テーブルのカラム一覧（Catalog の API を経由せず information_schema を直接参照する検証用の正）
+_TABLE_COLUMNS_SQL = (
+    "SELECT column_name FROM information_schema.columns WHERE table_name = 'filings'"
+)
+
 
 def _table_columns(catalog: Catalog) -> set[str]:
     """filings テーブルのカラム名一覧を取得（テスト用）。"""
-    rows = catalog.conn.execute(
-        """
-        SELECT column_name FROM information_schema.columns
-        WHERE table_name = 'filings'
-        ORDER BY ordinal_position
-        """
-    ).fetchall()
-    return {row[0] for row in rows}
+    return {row[0] for row in catalog.conn.execute(_TABLE_COLUMNS_SQL).fetchall()}
 
 
 @pytest.mark.module
@@ -46,16 +51,14 @@ class TestCatalog_Index_IndexedColumns:
         class ExtendedFiling(Filing):
             ticker: Annotated[str, Field(indexed=True, description="Ticker")]
 
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         filing = ExtendedFiling(
             id="ext_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=datetime.now(),
+            created_at=_NOW,
             ticker="7203",
         )
         catalog.index(filing)
@@ -64,6 +67,15 @@ class TestCatalog_Index_IndexedColumns:
         assert "ticker" in columns
         assert initial_columns < columns
 
+        # order_by / 検索条件で使えるよう、追加カラムにはインデックスも作成される
+        index_names = {
+            row[0]
+            for row in catalog.conn.execute(
+                "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'filings'"
+            ).fetchall()
+        }
+        assert "idx_ticker" in index_names
+
     def test_get_raw_includes_extended_indexed_field_in_data(
         self, temp_catalog: Catalog
     ) -> None:
@@ -73,13 +85,11 @@ class TestCatalog_Index_IndexedColumns:
         class ExtendedFiling(Filing):
             ticker: Annotated[str, Field(indexed=True, description="Ticker")]
 
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         created = datetime(2024, 1, 15, 10, 0, 0)
         filing = ExtendedFiling(
             id="get_ext_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
@@ -105,15 +115,13 @@ class TestCatalog_Index_IndexedColumns:
         class ExtendedFiling(Filing):
             ticker: Annotated[str, Field(indexed=True, description="Ticker")]
 
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
         base_time = datetime(2024, 1, 15, 10, 0, 0)
 
         for i, ticker in enumerate(["0001", "0002", "0003"]):
             filing = ExtendedFiling(
                 id=f"search_order_{i}",
                 source="test",
-                checksum=checksum,
+                checksum=_CHECKSUM,
                 name="f.txt",
                 is_zip=False,
                 format="xbrl",
@@ -124,10 +132,11 @@ class TestCatalog_Index_IndexedColumns:
 
         results = catalog.search(order_by="ticker", limit=10, desc=False)
         assert len(results) >= 3
+        # search の結果は物理カラムを含めて復元済みのため、get_raw で引き直さない
         tickers = [
-            catalog.get_raw(r.id).get("ticker")
+            ticker
             for r in results
-            if catalog.get_raw(r.id) and catalog.get_raw(r.id).get("ticker") is not None
+            if (ticker := getattr(r, "ticker", None)) is not None
         ]
         assert len(tickers) >= 3
         assert tickers == sorted(tickers)
@@ -139,27 +148,23 @@ class TestCatalog_Index_IndexedColumns:
         class ExtendedFiling(Filing):
             ticker: Annotated[str, Field(indexed=True, description="Ticker")]
 
-        content = b"dummy"
-        checksum = hashlib.sha256(content).hexdigest()
-        now = datetime.now()
-
         base_filing = Filing(
             id="batch_base_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.txt",
             is_zip=False,
             format="xbrl",
-            created_at=now,
+            created_at=_NOW,
         )
         extended_filing = ExtendedFiling(
             id="batch_ext_001",
             source="test",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f2.txt",
             is_zip=False,
             format="xbrl",
-            created_at=now,
+            created_at=_NOW,
             ticker="7203",
         )
 
@@ -182,12 +187,10 @@ class TestCatalog_Index_IndexedColumns:
     ) -> None:
         """EdgarCompanyFactsFiling の tickers_key を Field(...).contains で検索できる"""
         catalog = temp_catalog
-        content = b"{}"
-        checksum = hashlib.sha256(content).hexdigest()
         created = datetime(2024, 1, 15, 10, 0, 0)
         f1 = EdgarCompanyFactsFiling(
             id="facts_edgar_aa",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="a.json",
             is_zip=False,
             format="json",
@@ -204,7 +207,7 @@ class TestCatalog_Index_IndexedColumns:
         )
         f2 = EdgarCompanyFactsFiling(
             id="facts_edgar_cc",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="b.json",
             is_zip=False,
             format="json",
@@ -231,12 +234,10 @@ class TestCatalog_Index_IndexedColumns:
     ) -> None:
         """EdgarCompanyFactsFiling の edgar_resource_kind（indexed）を等価検索できる"""
         catalog = temp_catalog
-        content = b"{}"
-        checksum = hashlib.sha256(content).hexdigest()
         created = datetime(2024, 1, 15, 10, 0, 0)
         f_company = EdgarCompanyFactsFiling(
             id="facts_kind_cf",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="cf.json",
             is_zip=False,
             format="json",
@@ -253,7 +254,7 @@ class TestCatalog_Index_IndexedColumns:
         )
         f_other = EdgarCompanyFactsFiling(
             id="facts_kind_other",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="other.json",
             is_zip=False,
             format="json",
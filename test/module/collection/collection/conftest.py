@@ -0,0 +1,10 @@
+import pytest
+from support.memory_storage import MemoryStorage
+
+from fino_filing import Catalog, Collection
+
+
+@pytest.fixture
+def collection(mem_storage: MemoryStorage, temp_catalog: Catalog) -> Collection:
+    """mem_storage / temp_catalog を使う Collection（テスト本体で都度構築しない。content はメモリに保持する）"""
+    return Collection(storage=mem_storage, catalog=temp_catalog)
@@ -129,8 +129,8 @@ class TestCollection_Add:
         datetime_now: datetime,
     ) -> None:
         """継承したFilingでも追加できる (EDINETFiling)"""
-        content = b"test content"
-        checksum = hashlib.sha256(content).hexdigest()
+        filing, content = sample_filing
+        checksum = filing.checksum
         edinet_filing = EDINETFiling(
             checksum=checksum,
             name="test_filing.txt",
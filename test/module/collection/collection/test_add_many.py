@@ -0,0 +1,184 @@
+import hashlib
+from datetime import datetime
+from typing import Annotated
+
+import duckdb
+import pytest
+from support.memory_storage import MemoryStorage
+
+from fino_filing import Catalog, Collection, Field, Filing
+from fino_filing.collection.error import CollectionChecksumMismatchError
+from fino_filing.collection.storage import SupportsSaveMany
+from fino_filing.collection.storages import LocalStorage
+
+
+def _make_filing(id: str, content: bytes, created_at: datetime) -> Filing:
+    return Filing(
+        id=id,
+        source="test",
+        checksum=hashlib.sha256(content).hexdigest(),
+        name=f"{id}.xbrl",
+        is_zip=False,
+        format="xbrl",
+        created_at=created_at,
+    )
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCollection_AddMany:
+    """
+    Collection.add_many(). 観点: 正常系、異常系（checksum 不一致）、契約（既存 id は catalog をスキップ、save_many 非対応の Storage は save で保存、索引に失敗したら storage に保存しない）
+    """
+
+    def test_add_many_filings_and_contents_success(
+        self,
+        temp_storage: LocalStorage,
+        temp_catalog: Catalog,
+        datetime_now: datetime,
+    ) -> None:
+        """複数の Filing と content を一括で追加でき、入力順に (Filing, path) が返る"""
+        contents = [b"first", b"second", b"third"]
+        items = [
+            (_make_filing(f"many_{i}", content, datetime_now), content)
+            for i, content in enumerate(contents)
+        ]
+        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+
+        results = collection.add_many(items)
+
+        assert [filing.id for filing, _ in results] == ["many_0", "many_1", "many_2"]
+        assert temp_catalog.count() == 3
+        for (filing, content), (_, path) in zip(items, results):
+            assert path.endswith(".xbrl")
+            with open(path, "rb") as f:
+                assert f.read() == content
+            assert collection.get_content(filing.id) == content
+
+    def test_add_many_empty_is_noop(
+        self,
+        temp_storage: LocalStorage,
+        temp_catalog: Catalog,
+    ) -> None:
+        """空の入力では何も保存せず空リストを返す"""
+        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+
+        assert collection.add_many([]) == []
+        assert temp_catalog.count() == 0
+
+    def test_add_many_checksum_mismatch_saves_nothing(
+        self,
+        temp_storage: LocalStorage,
+        temp_catalog: Catalog,
+        datetime_now: datetime,
+    ) -> None:
+        """1 件でも checksum が不一致なら CollectionChecksumMismatchError となり、catalog / storage に何も保存されない"""
+        valid = _make_filing("many_valid", b"valid", datetime_now)
+        invalid = _make_filing("many_invalid", b"expected", datetime_now)
+        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+
+        with pytest.raises(CollectionChecksumMismatchError) as e:
+            collection.add_many([(valid, b"valid"), (invalid, b"actual")])
+
+        assert e.value.filing_id == "many_invalid"
+        assert temp_catalog.count() == 0
+        assert collection.get_content("many_valid") is None
+        assert not any(temp_storage.base_dir.rglob("*.xbrl"))
+
+    def test_add_many_existing_id_skips_catalog_and_overwrites_storage(
+        self,
+        temp_storage: LocalStorage,
+        temp_catalog: Catalog,
+        datetime_now: datetime,
+    ) -> None:
+        """既に add 済みの id は catalog をスキップし、storage は上書きする（add と同じ契約）"""
+        first = _make_filing("many_same", b"first", datetime_now)
+        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+        collection.add(first, b"first")
+
+        second = Filing(
+            id="many_same",
+            source="test",
+            checksum=hashlib.sha256(b"second").hexdigest(),
+            name="many_same.xbrl",
+            is_zip=False,
+            format="xbrl",
+            created_at=datetime_now,
+        )
+        collection.add_many([(second, b"second")])
+
+        assert temp_catalog.count() == 1
+        restored = temp_catalog.get("many_same")
+        assert restored is not None
+        assert restored.checksum == first.checksum
+        assert collection.get_content("many_same") == b"second"
+
+    def test_add_many_storage_without_save_many(
+        self,
+        temp_storage: LocalStorage,
+        mem_storage: MemoryStorage,
+        temp_catalog: Catalog,
+        datetime_now: datetime,
+    ) -> None:
+        """SupportsSaveMany を満たさない Storage でも 1 件ずつ save して全件保存される"""
+        assert isinstance(temp_storage, SupportsSaveMany)
+        assert not isinstance(mem_storage, SupportsSaveMany)
+
+        contents = [b"first", b"second"]
+        items = [
+            (_make_filing(f"many_mem_{i}", content, datetime_now), content)
+            for i, content in enumerate(contents)
+        ]
+        collection = Collection(storage=mem_storage, catalog=temp_catalog)
+
+        results = collection.add_many(items)
+
+        assert [filing.id for filing, _ in results] == ["many_mem_0", "many_mem_1"]
+        for filing, content in items:
+            assert collection.get_content(filing.id) == content
+
+    def test_add_many_index_failure_saves_nothing(
+        self,
+        temp_storage: LocalStorage,
+        temp_catalog: Catalog,
+        datetime_now: datetime,
+    ) -> None:
+        """add と同じく catalog への索引を先に行い、索引に失敗した場合は storage に何も保存しない"""
+
+        class YearCodeFiling(Filing):
+            code: Annotated[int, Field(indexed=True, description="Code")]
+
+        class TextCodeFiling(Filing):
+            code: Annotated[str, Field(indexed=True, description="Code")]
+
+        # code カラムは先に登録した YearCodeFiling の型（BIGINT）で作られる
+        temp_catalog.index(
+            YearCodeFiling(
+                id="many_year",
+                source="test",
+                checksum="c" * 64,
+                name="many_year.xbrl",
+                is_zip=False,
+                format="xbrl",
+                created_at=datetime_now,
+                code=2024,
+            )
+        )
+        content = b"text code"
+        mismatched = TextCodeFiling(
+            id="many_text",
+            source="test",
+            checksum=hashlib.sha256(content).hexdigest(),
+            name="many_text.xbrl",
+            is_zip=False,
+            format="xbrl",
+            created_at=datetime_now,
+            code="E12345",
+        )
+        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+
+        with pytest.raises(duckdb.ConversionException):
+            collection.add_many([(mismatched, content)])
+
+        assert temp_catalog.get_raw("many_text") is None
+        assert not any(temp_storage.base_dir.rglob("*.xbrl"))
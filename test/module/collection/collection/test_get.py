@@ -1,10 +1,94 @@
 import hashlib
+from collections.abc import Iterator
 from datetime import date, datetime
+from pathlib import Path
 
 import pytest
+from support.memory_storage import MemoryStorage
 
-from fino_filing import Catalog, Collection, EDINETFiling, Filing
-from fino_filing.collection.storages import LocalStorage
+from fino_filing import Catalog, Collection, EDINETFiling, Filing, LocalStorage
+
+_POPULATED_CONTENT = b"populated content"
+_EDINET_CONTENT = b"test content"
+
+
+@pytest.fixture(scope="module")
+def edinet_filing_template() -> tuple[EDINETFiling, bytes]:
+    """
+    EDINETFiling と content の組（モジュールで 1 回だけ生成する）。
+    値はすべて固定値。add / get は Filing を変更しないため、テスト間で共有する。
+    """
+    created_at = datetime(2024, 1, 15, 10, 0, 0)
+    period = date(2024, 1, 15)
+    edinet_filing = EDINETFiling(
+        id="test_id_edinet",
+        checksum=hashlib.sha256(_EDINET_CONTENT).hexdigest(),
+        name="test_filing.txt",
+        is_zip=False,
+        format="xbrl",
+        created_at=created_at,
+        doc_id="test_doc_id",
+        edinet_code="test_edinet_code",
+        sec_code="test_sec_code",
+        jcn="test_jcn",
+        filer_name="test_filer_name",
+        ordinance_code="test_ordinance_code",
+        form_code="test_form_code",
+        doc_type_code="test_doc_type_code",
+        doc_description="test_doc_description",
+        period_start=period,
+        period_end=period,
+        submit_datetime=created_at,
+    )
+    return edinet_filing, _EDINET_CONTENT
+
+
+@pytest.fixture(scope="module")
+def populated_collection() -> Iterator[tuple[Collection, Filing, bytes, str]]:
+    """
+    1 件を add 済みの Collection（モジュールで 1 回だけ add する）。
+    戻り値: (collection, 追加した Filing, content, add が返した path)
+    """
+    catalog = Catalog(":memory:")
+    collection = Collection(storage=MemoryStorage(), catalog=catalog)
+    filing = Filing(
+        id="populated_id_001",
+        source="test_source",
+        checksum=hashlib.sha256(_POPULATED_CONTENT).hexdigest(),
+        name="populated.xbrl",
+        is_zip=False,
+        format="xbrl",
+        created_at=datetime(2024, 1, 15, 10, 0, 0),
+    )
+    _, path = collection.add(filing, _POPULATED_CONTENT)
+    yield collection, filing, _POPULATED_CONTENT, path
+    catalog.close()
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCollection_Getters:
+    """
+    Collection の get / get_filing / get_content / get_path を、1 回の add の結果に対してまとめて検証する。
+    - 正常系: add 後に各 getter で Filing / content / path が取得できる
+    """
+
+    @pytest.mark.parametrize("getter", ["get", "get_filing", "get_content", "get_path"])
+    def test_getters_return_added_filing(
+        self,
+        populated_collection: tuple[Collection, Filing, bytes, str],
+        getter: str,
+    ) -> None:
+        """add した Filing / content / path を各 getter が返す（get は 3 つ組）"""
+        collection, filing, content, path = populated_collection
+        expected = {
+            "get": (filing, content, path),
+            "get_filing": filing,
+            "get_content": content,
+            "get_path": path,
+        }[getter]
+
+        assert getattr(collection, getter)(filing.id) == expected
 
 
 @pytest.mark.module
@@ -15,18 +99,18 @@ class TestCollection_Get:
     - 正常系: add後にgetでFilingとcontentが取得できる
     - 正常系: EDINETFilingで保存した場合はgetでEDINETFilingとして返る
     - 正常系: 存在しないidでNoneが返る
+    - 境界: 実体ファイルが無い場合は content のみ None
     """
 
     # TODO: 既存のdbが存在する場合に既存のFilingが返る
 
     def test_get_filing_and_content_success(
         self,
-        temp_storage: LocalStorage,
+        collection: Collection,
         temp_catalog: Catalog,
         sample_filing: tuple[Filing, bytes],
     ) -> None:
         """Filingとcontentが取得できる"""
-        collection = Collection(storage=temp_storage, catalog=temp_catalog)
         filing, content = sample_filing
 
         # add
@@ -36,15 +120,13 @@ class TestCollection_Get:
         assert isinstance(actual_path, str)
         assert isinstance(saved_filing, Filing)
 
+        assert saved_filing.id == filing.id
         assert temp_catalog.get(filing.id) is not None
-        assert temp_catalog.get(saved_filing.id) is not None
 
         # catalogに登録されていることを確認
         filing, content, path = collection.get(filing.id)
-        assert filing is not None
         assert isinstance(filing, Filing)
         assert filing.id == saved_filing.id
-        assert filing.name == saved_filing.name
         assert content is not None
         assert isinstance(content, bytes)
         assert content == b"test content"
@@ -55,63 +137,24 @@ class TestCollection_Get:
 
     def test_get_filing_returns_edinet_filing_when_saved_as_edinet(
         self,
-        temp_storage: LocalStorage,
-        temp_catalog: Catalog,
-        datetime_now: datetime,
-        date_now: date,
+        collection: Collection,
+        edinet_filing_template: tuple[EDINETFiling, bytes],
     ) -> None:
         """EDINETFilingでaddした場合、get_filingでEDINETFilingとして復元される"""
-        content = b"test content"
-        checksum = hashlib.sha256(content).hexdigest()
-        edinet_filing = EDINETFiling(
-            id="test_id_edinet",
-            checksum=checksum,
-            name="test_filing.txt",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-            doc_id="test_doc_id",
-            edinet_code="test_edinet_code",
-            sec_code="test_sec_code",
-            jcn="test_jcn",
-            filer_name="test_filer_name",
-            ordinance_code="test_ordinance_code",
-            form_code="test_form_code",
-            doc_type_code="test_doc_type_code",
-            doc_description="test_doc_description",
-            period_start=date_now,
-            period_end=date_now,
-            submit_datetime=datetime_now,
-        )
-        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+        edinet_filing, content = edinet_filing_template
         collection.add(edinet_filing, content)
 
         filing = collection.get_filing(edinet_filing.id)
-        assert filing is not None
         assert isinstance(filing, EDINETFiling)
-        assert filing.id == edinet_filing.id
-        assert filing.doc_id == edinet_filing.doc_id
-        assert filing.edinet_code == edinet_filing.edinet_code
-        assert filing.sec_code == edinet_filing.sec_code
-        assert filing.jcn == edinet_filing.jcn
-        assert filing.filer_name == edinet_filing.filer_name
-        assert filing.ordinance_code == edinet_filing.ordinance_code
-        assert filing.form_code == edinet_filing.form_code
-        assert filing.doc_type_code == edinet_filing.doc_type_code
-        assert filing.doc_description == edinet_filing.doc_description
-        assert filing.period_start == edinet_filing.period_start
-        assert filing.period_end == edinet_filing.period_end
-        assert filing.submit_datetime == edinet_filing.submit_datetime
-        assert filing.parent_doc_id == edinet_filing.parent_doc_id
+        # Filing.__eq__ は同一クラスかつ全フィールド一致で True（不一致時は pytest が差分を表示する）
+        assert filing == edinet_filing
 
     def test_get_filing_and_content_not_found(
         self,
-        temp_storage: LocalStorage,
-        temp_catalog: Catalog,
+        collection: Collection,
         sample_filing: tuple[Filing, bytes],
     ) -> None:
         """存在しない場合、Noneが返る"""
-        collection = Collection(storage=temp_storage, catalog=temp_catalog)
         filing, content = sample_filing
         collection.add(filing, content)
 
@@ -119,3 +162,22 @@ class TestCollection_Get:
         assert filing is None
         assert content is None
         assert path is None
+
+    def test_get_content_missing_file_returns_path_only(
+        self,
+        temp_storage: LocalStorage,
+        temp_catalog: Catalog,
+        sample_filing: tuple[Filing, bytes],
+    ) -> None:
+        """catalog にあり実体ファイルが無い場合、Filing と path は返り content は None になる"""
+        # ディスク上のファイルを消すため、この検証のみ LocalStorage を使う
+        collection = Collection(storage=temp_storage, catalog=temp_catalog)
+        filing, content = sample_filing
+        _, actual_path = collection.add(filing, content)
+        Path(actual_path).unlink()
+
+        got_filing, got_content, path = collection.get(filing.id)
+        assert got_filing is not None
+        assert got_filing.id == filing.id
+        assert got_content is None
+        assert path == actual_path
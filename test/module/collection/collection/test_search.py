@@ -1,14 +1,134 @@
-"""Collection.search の結合テスト。観点: 正常系（復元型）、expr 指定時のパラメータバインド"""
+"""Collection.search の結合テスト。観点: 正常系（全件・ページング・並び順・復元型）、expr 指定時のパラメータバインド"""
 
 import hashlib
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import date, datetime
 
 import pytest
-
-from fino_filing import Catalog, Collection, EdgarArchiveFiling, EDINETFiling, Field
+from support.memory_storage import MemoryStorage
+
+from fino_filing import (
+    Catalog,
+    Collection,
+    EdgarArchiveFiling,
+    EDINETFiling,
+    Expr,
+    Field,
+    Filing,
+)
 from fino_filing.collection.error import CatalogExprTypeError
 from fino_filing.collection.storages import LocalStorage
 
+# 検索テストで保存する content とその checksum（import 時に 1 回だけ計算する）
+_CONTENT = b"test content"
+_CHECKSUM = hashlib.sha256(_CONTENT).hexdigest()
+
+# seeded_collection に登録する件数（source は source_0..2 に分散、created_at は 1 日ずつずらす）
+_SEEDED_COUNT = 10
+
+
+@pytest.fixture(scope="module")
+def seeded_collection() -> Iterator[Collection]:
+    """
+    _SEEDED_COUNT 件を add_many で 1 回だけ登録した Collection（検索のみのテストで共有する）。
+    catalog はインメモリ、storage は MemoryStorage。
+    """
+    items: list[tuple[Filing, bytes]] = []
+    for i in range(_SEEDED_COUNT):
+        content = f"test content {i}".encode()
+        filing = Filing(
+            id=f"test_id_{i:03d}",
+            source=f"source_{i % 3}",
+            checksum=hashlib.sha256(content).hexdigest(),
+            name=f"test_filing_{i}.txt",
+            is_zip=i % 2 == 0,
+            format="xbrl",
+            created_at=datetime(2024, 1, 1 + i, 12, 0, 0),
+        )
+        items.append((filing, content))
+
+    catalog = Catalog(":memory:")
+    collection = Collection(storage=MemoryStorage(), catalog=catalog)
+    collection.add_many(items)
+    yield collection
+    catalog.close()
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestCollection_Search_Paging:
+    """
+    Collection.search. 観点: 正常系（全件・expr・limit/offset・order_by）、境界（空の Collection）
+    登録は seeded_collection でモジュールに 1 回だけ行い、各テストは検索のみ行う。
+    """
+
+    def test_search_all_filings(self, seeded_collection: Collection) -> None:
+        """expr なしで全件が Filing として返る"""
+        results = seeded_collection.search()
+
+        assert len(results) == _SEEDED_COUNT
+        assert all(isinstance(f, Filing) for f in results)
+
+    def test_search_with_expr(self, seeded_collection: Collection) -> None:
+        """expr で source_1 のみ返る（1, 4, 7 の 3 件）"""
+        results = seeded_collection.search(expr=Expr("source = ?", ["source_1"]))
+
+        assert {f.id for f in results} == {"test_id_001", "test_id_004", "test_id_007"}
+
+    def test_search_with_limit_offset(self, seeded_collection: Collection) -> None:
+        """limit / offset で返る範囲が変わる"""
+        results = seeded_collection.search(limit=3)
+        results_with_offset = seeded_collection.search(limit=3, offset=5)
+
+        assert len(results) == 3
+        assert len(results_with_offset) == 3
+        assert {f.id for f in results}.isdisjoint(f.id for f in results_with_offset)
+
+    def test_search_with_order_by(self, seeded_collection: Collection) -> None:
+        """order_by / desc で並び順が変わる（既定は created_at 降順）"""
+        results_asc = seeded_collection.search(order_by="created_at", desc=False)
+        results_desc = seeded_collection.search()
+
+        assert results_asc[0].id == "test_id_000"
+        assert results_asc[-1].id == "test_id_009"
+        assert [f.id for f in results_desc] == [f.id for f in reversed(results_asc)]
+
+    def test_search_empty_collection(self, collection: Collection) -> None:
+        """何も登録していない Collection では空リストを返す"""
+        assert collection.search() == []
+
+
+@pytest.fixture(scope="class")
+def edinet_populated_collection(
+    datetime_now: datetime, date_now: date
+) -> Iterator[tuple[Collection, EDINETFiling]]:
+    """EDINETFiling を 1 件だけ add した Collection（TestCollection_Search_ReturnType のテストで共有する）"""
+    edinet_filing = EDINETFiling(
+        id="test_id_edinet_find",
+        checksum=_CHECKSUM,
+        name="test_filing.txt",
+        is_zip=False,
+        format="xbrl",
+        created_at=datetime_now,
+        doc_id="test_doc_id",
+        edinet_code="test_edinet_code",
+        sec_code="test_sec_code",
+        jcn="test_jcn",
+        filer_name="test_filer_name",
+        ordinance_code="test_ordinance_code",
+        form_code="test_form_code",
+        doc_type_code="test_doc_type_code",
+        doc_description="test_doc_description",
+        period_start=date_now,
+        period_end=date_now,
+        submit_datetime=datetime_now,
+    )
+    catalog = Catalog(":memory:")
+    collection = Collection(storage=MemoryStorage(), catalog=catalog)
+    collection.add(edinet_filing, _CONTENT)
+    yield collection, edinet_filing
+    catalog.close()
+
 
 @pytest.mark.module
 @pytest.mark.collection
@@ -17,42 +137,24 @@ class TestCollection_Search_ReturnType:
 
     def test_search_returns_edinet_filing_when_saved_as_edinet(
         self,
-        temp_storage: LocalStorage,
-        temp_catalog: Catalog,
-        datetime_now: datetime,
+        edinet_populated_collection: tuple[Collection, EDINETFiling],
     ) -> None:
         """EDINETFiling で add した場合、search で EDINETFiling として復元される"""
-        content = b"test content"
-        checksum = hashlib.sha256(content).hexdigest()
-        edinet_filing = EDINETFiling(
-            id="test_id_edinet_find",
-            checksum=checksum,
-            name="test_filing.txt",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-            doc_id="test_doc_id",
-            edinet_code="test_edinet_code",
-            sec_code="test_sec_code",
-            jcn="test_jcn",
-            filer_name="test_filer_name",
-            ordinance_code="test_ordinance_code",
-            form_code="test_form_code",
-            doc_type_code="test_doc_type_code",
-            doc_description="test_doc_description",
-            period_start=datetime_now,
-            period_end=datetime_now,
-            submit_datetime=datetime_now,
-        )
-        collection = Collection(storage=temp_storage, catalog=temp_catalog)
-        collection.add(edinet_filing, content)
+        collection, edinet_filing = edinet_populated_collection
 
         results = collection.search(limit=10)
-        assert len(results) >= 1
-        filing = next(f for f in results if f.id == edinet_filing.id)
-        assert isinstance(filing, EDINETFiling)
-        assert filing.edinet_code == edinet_filing.edinet_code
-        assert filing.filer_name == edinet_filing.filer_name
+        assert [f.id for f in results] == [edinet_filing.id]
+        assert isinstance(results[0], EDINETFiling)
+
+    def test_search_restores_all_fields(
+        self,
+        edinet_populated_collection: tuple[Collection, EDINETFiling],
+    ) -> None:
+        """search で復元した EDINETFiling は add した Filing と全フィールドが一致する"""
+        collection, edinet_filing = edinet_populated_collection
+
+        results = collection.search(expr=Field("edinet_code") == "test_edinet_code")
+        assert results == [edinet_filing]
 
 
 @pytest.mark.module
@@ -83,13 +185,11 @@ class TestCollection_Search_WithExpr:
         datetime_now: datetime,
     ) -> None:
         """expr=(Field('source') == 'EDGAR') で検索すると EDGAR のみ返り、Conversion Error が発生しない"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         edgar_filing = EdgarArchiveFiling(
             id="edgar_1",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="edgar.htm",
             is_zip=False,
             format="htm",
@@ -103,7 +203,7 @@ class TestCollection_Search_WithExpr:
         )
         edinet_filing = EDINETFiling(
             id="edinet_1",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="edinet.pdf",
             is_zip=False,
             format="pdf",
@@ -121,8 +221,8 @@ class TestCollection_Search_WithExpr:
             period_end=datetime_now,
             submit_datetime=datetime_now,
         )
-        collection.add(edgar_filing, content)
-        collection.add(edinet_filing, content)
+        collection.add(edgar_filing, _CONTENT)
+        collection.add(edinet_filing, _CONTENT)
 
         results = collection.search(expr=(Field("source") == "EDGAR"), limit=10)
         assert len(results) == 1
@@ -137,12 +237,10 @@ class TestCollection_Search_WithExpr:
         datetime_now: datetime,
     ) -> None:
         """Field('source') == EdgarArchiveFiling.source は Field('source') == 'EDGAR' と同一挙動（クラス参照でデフォルト値を返す）"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
         edgar_filing = EdgarArchiveFiling(
             id="edgar_1",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="f.htm",
             is_zip=False,
             format="htm",
@@ -154,7 +252,7 @@ class TestCollection_Search_WithExpr:
             filing_date=datetime_now,
             period_of_report=datetime_now,
         )
-        collection.add(edgar_filing, content)
+        collection.add(edgar_filing, _CONTENT)
 
         by_string = collection.search(expr=(Field("source") == "EDGAR"), limit=10)
         by_class_default = collection.search(
@@ -170,12 +268,10 @@ class TestCollection_Search_WithExpr:
         datetime_now: datetime,
     ) -> None:
         """EDINETFiling.source == 'EDINET' で検索すると EDINET のみ返る（デフォルトありフィールドを左辺にした Expr）"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
         edgar_filing = EdgarArchiveFiling(
             id="edgar_1",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="edgar.htm",
             is_zip=False,
             format="htm",
@@ -189,7 +285,7 @@ class TestCollection_Search_WithExpr:
         )
         edinet_filing = EDINETFiling(
             id="edinet_1",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="edinet.pdf",
             is_zip=False,
             format="pdf",
@@ -207,8 +303,8 @@ class TestCollection_Search_WithExpr:
             period_end=datetime_now,
             submit_datetime=datetime_now,
         )
-        collection.add(edgar_filing, content)
-        collection.add(edinet_filing, content)
+        collection.add(edgar_filing, _CONTENT)
+        collection.add(edinet_filing, _CONTENT)
 
         results = collection.search(expr=(EDINETFiling.source == "EDINET"), limit=10)
         assert len(results) == 1
@@ -223,12 +319,10 @@ class TestCollection_Search_WithExpr:
         datetime_now: datetime,
     ) -> None:
         """Field('source') == EDINETFiling.source は Field('source') == 'EDINET' と同一挙動（右辺で参照オブジェクト）"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
         edinet_filing = EDINETFiling(
             id="edinet_1",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="edinet.pdf",
             is_zip=False,
             format="pdf",
@@ -246,7 +340,7 @@ class TestCollection_Search_WithExpr:
             period_end=datetime_now,
             submit_datetime=datetime_now,
         )
-        collection.add(edinet_filing, content)
+        collection.add(edinet_filing, _CONTENT)
 
         by_string = collection.search(expr=(Field("source") == "EDINET"), limit=10)
         by_class_ref = collection.search(
@@ -262,15 +356,13 @@ class TestCollection_Search_WithExpr:
         datetime_now: datetime,
     ) -> None:
         """count(expr=(Field('source') == 'EDGAR')) が条件一致件数を返し、Conversion Error が発生しない"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         for i, source in enumerate(["EDGAR", "EDINET", "EDGAR"]):
             if source == "EDGAR":
                 f = EdgarArchiveFiling(
                     id=f"edgar_{i}",
-                    checksum=checksum,
+                    checksum=_CHECKSUM,
                     name="f.htm",
                     is_zip=False,
                     format="htm",
@@ -285,7 +377,7 @@ class TestCollection_Search_WithExpr:
             else:
                 f = EDINETFiling(
                     id=f"edinet_{i}",
-                    checksum=checksum,
+                    checksum=_CHECKSUM,
                     name="f.pdf",
                     is_zip=False,
                     format="pdf",
@@ -303,7 +395,7 @@ class TestCollection_Search_WithExpr:
                     period_end=datetime_now,
                     submit_datetime=datetime_now,
                 )
-            collection.add(f, content)
+            collection.add(f, _CONTENT)
 
         n = temp_catalog.count(expr=(Field("source") == "EDGAR"))
         assert n == 2
@@ -321,13 +413,11 @@ class TestCollection_Search_Expr_DSL:
         datetime_now: datetime,
     ) -> None:
         """expr=Field('name').contains('10-K') で name に '10-K' を含むものだけ返る"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         with_10k = EdgarArchiveFiling(
             id="with_10k",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="annual_10-K_report.htm",
             is_zip=False,
             format="htm",
@@ -341,7 +431,7 @@ class TestCollection_Search_Expr_DSL:
         )
         without_10k = EdgarArchiveFiling(
             id="without_10k",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="other_report.htm",
             is_zip=False,
             format="htm",
@@ -353,8 +443,8 @@ class TestCollection_Search_Expr_DSL:
             filing_date=datetime_now,
             period_of_report=datetime_now,
         )
-        collection.add(with_10k, content)
-        collection.add(without_10k, content)
+        collection.add(with_10k, _CONTENT)
+        collection.add(without_10k, _CONTENT)
 
         results = collection.search(expr=Field("name").contains("10-K"), limit=10)
         assert len(results) == 1
@@ -368,13 +458,11 @@ class TestCollection_Search_Expr_DSL:
         datetime_now: datetime,
     ) -> None:
         """expr=Field('source').in_(['EDGAR']) で source が EDGAR の 1 件だけ返る"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         edgar_filing = EdgarArchiveFiling(
             id="edgar_in",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="e.htm",
             is_zip=False,
             format="htm",
@@ -388,7 +476,7 @@ class TestCollection_Search_Expr_DSL:
         )
         edinet_filing = EDINETFiling(
             id="edinet_in",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="i.pdf",
             is_zip=False,
             format="pdf",
@@ -406,8 +494,8 @@ class TestCollection_Search_Expr_DSL:
             period_end=datetime_now,
             submit_datetime=datetime_now,
         )
-        collection.add(edgar_filing, content)
-        collection.add(edinet_filing, content)
+        collection.add(edgar_filing, _CONTENT)
+        collection.add(edinet_filing, _CONTENT)
 
         results = collection.search(expr=Field("source").in_(["EDGAR"]), limit=10)
         assert len(results) == 1
@@ -421,8 +509,6 @@ class TestCollection_Search_Expr_DSL:
         datetime_now: datetime,
     ) -> None:
         """expr=Field('created_at').between(lo, hi) で範囲内の件だけ返る（物理カラムを使用）"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         base = datetime_now
@@ -431,7 +517,7 @@ class TestCollection_Search_Expr_DSL:
 
         filing_inside = EdgarArchiveFiling(
             id="inside",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="inside.htm",
             is_zip=False,
             format="htm",
@@ -445,7 +531,7 @@ class TestCollection_Search_Expr_DSL:
         )
         filing_outside = EdgarArchiveFiling(
             id="outside",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="outside.htm",
             is_zip=False,
             format="htm",
@@ -457,8 +543,8 @@ class TestCollection_Search_Expr_DSL:
             filing_date=outside_ts,
             period_of_report=outside_ts,
         )
-        collection.add(filing_inside, content)
-        collection.add(filing_outside, content)
+        collection.add(filing_inside, _CONTENT)
+        collection.add(filing_outside, _CONTENT)
 
         lo = datetime(base.year - 1, 5, 1)
         hi = datetime(base.year - 1, 7, 1)
@@ -473,13 +559,11 @@ class TestCollection_Search_Expr_DSL:
         datetime_now: datetime,
     ) -> None:
         """(Field('source') == 'EDGAR') & (Field('name').contains('10-K')) で両方一致するものだけ返る"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         k = EdgarArchiveFiling(
             id="edgar_10k",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="annual_10-K_report.htm",
             is_zip=False,
             format="htm",
@@ -493,7 +577,7 @@ class TestCollection_Search_Expr_DSL:
         )
         q = EdgarArchiveFiling(
             id="edgar_10q",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="quarterly_10-Q_report.htm",
             is_zip=False,
             format="htm",
@@ -505,8 +589,8 @@ class TestCollection_Search_Expr_DSL:
             filing_date=datetime_now,
             period_of_report=datetime_now,
         )
-        collection.add(k, content)
-        collection.add(q, content)
+        collection.add(k, _CONTENT)
+        collection.add(q, _CONTENT)
 
         results = collection.search(
             expr=(Field("source") == "EDGAR") & (Field("name").contains("10-K")),
@@ -523,13 +607,11 @@ class TestCollection_Search_Expr_DSL:
         datetime_now: datetime,
     ) -> None:
         """(Field('source') == 'EDGAR') | (Field('source') == 'EDINET') で両方の source が返る"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
 
         edgar_filing = EdgarArchiveFiling(
             id="edgar_or",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="e.htm",
             is_zip=False,
             format="htm",
@@ -543,7 +625,7 @@ class TestCollection_Search_Expr_DSL:
         )
         edinet_filing = EDINETFiling(
             id="edinet_or",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="i.pdf",
             is_zip=False,
             format="pdf",
@@ -561,8 +643,8 @@ class TestCollection_Search_Expr_DSL:
             period_end=datetime_now,
             submit_datetime=datetime_now,
         )
-        collection.add(edgar_filing, content)
-        collection.add(edinet_filing, content)
+        collection.add(edgar_filing, _CONTENT)
+        collection.add(edinet_filing, _CONTENT)
 
         results = collection.search(
             expr=(Field("source") == "EDGAR") | (Field("source") == "EDINET"),
@@ -585,12 +667,10 @@ class TestCollection_Search_NonIndexedDataJson:
         datetime_now: datetime,
     ) -> None:
         """form_code は indexed でなく data JSON のみ；モデル左辺の等価検索が Conversion Error なく一致件を返す"""
-        content = b"content"
-        checksum = hashlib.sha256(content).hexdigest()
         collection = Collection(storage=temp_storage, catalog=temp_catalog)
         target = EDINETFiling(
             id="edinet_form_053",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="fc.pdf",
             is_zip=False,
             format="pdf",
@@ -610,7 +690,7 @@ class TestCollection_Search_NonIndexedDataJson:
         )
         other = EDINETFiling(
             id="edinet_form_other",
-            checksum=checksum,
+            checksum=_CHECKSUM,
             name="other.pdf",
             is_zip=False,
             format="pdf",
@@ -628,8 +708,8 @@ class TestCollection_Search_NonIndexedDataJson:
             period_end=datetime_now,
             submit_datetime=datetime_now,
         )
-        collection.add(target, content)
-        collection.add(other, content)
+        collection.add(target, _CONTENT)
+        collection.add(other, _CONTENT)
 
         results = collection.search(expr=(EDINETFiling.form_code == "053000"), limit=10)
         assert len(results) == 1
@@ -6,43 +6,59 @@ from fino_filing import Filing
 from fino_filing.collection.locator import Locator
 
 
+@pytest.fixture(scope="module")
+def locator() -> Locator:
+    """状態を持たないため、モジュールで 1 つを共有する"""
+    return Locator()
+
+
 @pytest.mark.module
 @pytest.mark.collection
 class TestLocator_Resolve:
     """
     Locatorのresolveメソッドをテストする。
-    - 正常系: 正しいFilingでresolve成功
-    - 正常系: zip化されているときは .zip 拡張子が付く
+    - 正常系: 正しいFilingでresolve成功（{source}/{id} + 拡張子）
+    - 正常系: format が設定されていれば拡張子に使う（サニタイズ済み）
+    - 正常系: zip化されているときは format によらず .zip 拡張子が付く
+    - 境界: format が英数字と -_ 以外を含む場合は拡張子を付けない
     """
 
-    def test_resolve_uses_format_when_set_pdf(self) -> None:
-        """format=pdf のときは .pdf 拡張子が付く"""
-        locator = Locator()
+    @pytest.mark.parametrize(
+        ("id", "source", "is_zip", "format", "expected"),
+        [
+            # format=pdf のときは .pdf 拡張子が付く
+            ("doc:001", "edinet", False, "pdf", "edinet/doc:001.pdf"),
+            ("data:001", "custom", False, "csv", "custom/data:001.csv"),
+            # is_zip=True のときは format によらず .zip
+            ("test:001:abc12345", "test", True, "csv", "test/test:001:abc12345.zip"),
+            # format は前後空白・先頭ドット・大文字を正規化する
+            ("doc:002", "edinet", False, " .XBRL ", "edinet/doc:002.xbrl"),
+            # 英数字と -_ 以外を含む format は拡張子を付けない
+            ("doc:002", "edinet", False, "x/y", "edinet/doc:002"),
+        ],
+    )
+    def test_resolve(
+        self,
+        locator: Locator,
+        id: str,
+        source: str,
+        is_zip: bool,
+        format: str,
+        expected: str,
+    ) -> None:
+        """Filing の source / id / is_zip / format から保存パスを組み立てる"""
         filing = Filing(
-            id="doc:001",
-            source="edinet",
+            id=id,
+            source=source,
             checksum="abc",
-            name="report.pdf",
-            is_zip=False,
-            format="pdf",
+            name="report",
+            is_zip=is_zip,
+            format=format,
             created_at=datetime(2024, 1, 15),
         )
-        path = locator.resolve(filing)
-        assert path == "edinet/doc:001.pdf"
 
-    def test_resolve_success(self) -> None:
-        """正常なFilingでresolve成功"""
-        locator = Locator()
-        filing = Filing(
-            id="test:001:abc12345",
-            source="test",
-            checksum="1234567890",
-            name="test.zip",
-            is_zip=True,
-            format="csv",
-            created_at=datetime(2024, 1, 15),
-        )
-        path = locator.resolve(filing)
-        assert path is not None
-        assert isinstance(path, str)
-        assert path == "test/test:001:abc12345.zip"
+        assert locator.resolve(filing) == expected
+
+    def test_resolve_none(self, locator: Locator) -> None:
+        """Filing が None のときは None を返す"""
+        assert locator.resolve(None) is None
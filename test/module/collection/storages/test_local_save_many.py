@@ -0,0 +1,37 @@
+import pytest
+
+from fino_filing.collection.storages import LocalStorage
+
+
+@pytest.mark.module
+@pytest.mark.collection
+class TestLocalStorage_SaveMany:
+    """
+    LocalStorage.save_many(). 観点: 正常系、異常系（不正な storage_key）
+    """
+
+    def test_save_many_writes_all_contents(self, temp_storage: LocalStorage) -> None:
+        """複数の content を保存し、入力順に絶対パスを返す（同じディレクトリ・別ディレクトリを含む）"""
+        items = [
+            (b"first", "edinet/a.xbrl"),
+            (b"second", "edinet/b.xbrl"),
+            (b"third", "edgar/c.json"),
+        ]
+
+        paths = temp_storage.save_many(items)
+
+        assert len(paths) == 3
+        for (content, key), path in zip(items, paths):
+            assert path == str((temp_storage.base_dir / key).resolve())
+            assert temp_storage.load_by_path(key) == content
+
+    def test_save_many_invalid_key_writes_nothing(
+        self, temp_storage: LocalStorage
+    ) -> None:
+        """1 件でも storage_key が不正なら ValueError となり、何も書き込まれない"""
+        with pytest.raises(ValueError):
+            temp_storage.save_many(
+                [(b"valid", "edinet/valid.xbrl"), (b"invalid", "../escape.xbrl")]
+            )
+
+        assert not any(temp_storage.base_dir.rglob("*.xbrl"))
@@ -10,6 +10,7 @@ from fino_filing import (
     FilingResolver,
     default_resolver,
 )
+from fino_filing.collection import filing_resolver
 from fino_filing.collection.filing_resolver import register_filing_class
 
 
@@ -45,6 +46,68 @@ class TestFilingResolver_Register_Resolve:
         assert cls is None or cls is EDINETFiling
 
 
+@pytest.mark.module
+@pytest.mark.collection
+class TestFilingResolver_UnresolvedCache:
+    """FilingResolver.resolve の解決失敗キャッシュ. 観点: 契約（失敗した名前は再インポートしない、上限を超えたら古い名前から再試行する、register で解決できる）"""
+
+    def test_unresolvable_name_imports_only_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """解決できない名前は 2 回目以降 import を試みずに None を返す"""
+        resolver = FilingResolver()
+        calls = 0
+        original = resolver._resolve_by_import
+
+        def _counting_resolve_by_import(name: str) -> type[Filing] | None:
+            nonlocal calls
+            calls += 1
+            return original(name)
+
+        monkeypatch.setattr(resolver, "_resolve_by_import", _counting_resolve_by_import)
+        name = "no_such_package.module.MissingFiling"
+
+        assert resolver.resolve(name) is None
+        assert resolver.resolve(name) is None
+        assert calls == 1
+
+    def test_unresolved_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """記憶する失敗名は上限までで、溢れた最も古い名前は次の resolve で import を再試行する"""
+        monkeypatch.setattr(filing_resolver, "_MAX_UNRESOLVED", 2)
+        resolver = FilingResolver()
+        imported: list[str] = []
+        original = resolver._resolve_by_import
+
+        def _recording_resolve_by_import(name: str) -> type[Filing] | None:
+            imported.append(name)
+            return original(name)
+
+        monkeypatch.setattr(
+            resolver, "_resolve_by_import", _recording_resolve_by_import
+        )
+        names = [f"no_such_package.module.MissingFiling{i}" for i in range(3)]
+
+        for name in names:
+            assert resolver.resolve(name) is None
+        assert list(resolver._unresolved) == names[1:]
+
+        assert resolver.resolve(names[0]) is None
+        assert imported == [*names, names[0]]
+
+    def test_register_after_failed_resolve(self) -> None:
+        """解決に失敗した名前でも、後から register すれば解決できる"""
+
+        class LocalFiling(Filing):
+            pass
+
+        resolver = FilingResolver()
+        name = f"{LocalFiling.__module__}.{LocalFiling.__qualname__}"
+        assert resolver.resolve(name) is None
+
+        resolver.register(LocalFiling)
+        assert resolver.resolve(name) is LocalFiling
+
+
 @pytest.mark.module
 @pytest.mark.collection
 class TestDefaultResolver:
@@ -1,6 +1,5 @@
 """Collector テスト用 fixtures"""
 
-import tempfile
 from pathlib import Path
 from typing import Iterator
 
@@ -16,13 +15,10 @@ def edgar_config() -> EdgarConfig:
 
 
 @pytest.fixture
-def temp_collection() -> Iterator[tuple[Collection, Path]]:
-    """テスト用の一時 Collection（storage + catalog）。collector 用は (collection, base_path) を返す。"""
-    with tempfile.TemporaryDirectory(prefix="collector_test_") as tmpdir:
-        base = Path(tmpdir)
-        storage = LocalStorage(base / "storage")
-        catalog_path = base / "index.db"
-        catalog = Catalog(str(catalog_path))
-        collection = Collection(storage=storage, catalog=catalog)
-        yield collection, base
-        catalog.close()
+def temp_collection(tmp_path: Path) -> Iterator[tuple[Collection, Path]]:
+    """テスト用の一時 Collection（storage + インメモリ catalog）。collector 用は (collection, base_path) を返す。"""
+    storage = LocalStorage(tmp_path / "storage")
+    catalog = Catalog(":memory:")
+    collection = Collection(storage=storage, catalog=catalog)
+    yield collection, tmp_path
+    catalog.close()
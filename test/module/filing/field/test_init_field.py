@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 
 from fino_filing import Field
@@ -15,39 +17,43 @@ class TestField_Initialize:
     - 正常系: immutable=True のフィールドを設定された場合
     """
 
-    def test_field_initialize_with_positional_arguments(self) -> None:
-        field = Field("test_field", str, True, True, False, "test_description")
-
-        assert field.name == "test_field"
-        assert field._field_type is str
-        assert field.indexed is True
-        assert field.immutable is True
-        assert field.required is False
-        assert field.description == "test_description"
-
-    def test_field_initialize_with_named_arguments(self) -> None:
-        field = Field(
-            name="test_field",
-            _field_type=str,
-            indexed=True,
-            immutable=True,
-            required=True,
-            description="test_description",
-        )
-
-        assert field.name == "test_field"
-        assert field._field_type is str
-        assert field.indexed is True
-        assert field.immutable is True
-        assert field.required is True
-        assert field.description == "test_description"
-
-    def test_field_initialize_without_optional_arguments(self) -> None:
-        field = Field()
-
-        assert field.name == ""
-        assert field._field_type is None
-        assert field.indexed is False
-        assert field.immutable is False
-        assert field.required is False
-        assert field.description is None
+    @pytest.mark.parametrize(
+        ("args", "kwargs", "expected"),
+        [
+            # 全ての引数を位置引数で設定する
+            (
+                ("test_field", str, True, True, False, "test_description"),
+                {},
+                ("test_field", str, True, True, False, "test_description"),
+            ),
+            # 全ての引数を名前付き引数で設定する
+            (
+                (),
+                {
+                    "name": "test_field",
+                    "_field_type": str,
+                    "indexed": True,
+                    "immutable": True,
+                    "required": True,
+                    "description": "test_description",
+                },
+                ("test_field", str, True, True, True, "test_description"),
+            ),
+            # 引数なしのときはデフォルト値になる
+            ((), {}, ("", None, False, False, False, None)),
+        ],
+        ids=["positional", "named", "defaults"],
+    )
+    def test_field_initialize(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any], expected: tuple[Any, ...]
+    ) -> None:
+        field = Field(*args, **kwargs)
+
+        assert (
+            field.name,
+            field._field_type,
+            field.indexed,
+            field.immutable,
+            field.required,
+            field.description,
+        ) == expected
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from fino_filing import Filing
+
+
+@pytest.fixture(scope="module")
+def base_filing() -> Filing:
+    """等価判定・ラウンドトリップの基準となる Filing（テスト内で変更しない）"""
+    return Filing(
+        id="test_id",
+        source="test_source",
+        checksum="test_checksum",
+        name="test_name",
+        is_zip=True,
+        format="zip",
+        created_at=datetime(2024, 1, 15, 10, 30, 45, 123456),
+    )
+
+
+@pytest.fixture(scope="module")
+def canonical_dict(base_filing: Filing) -> dict[str, Any]:
+    """base_filing.to_dict() の結果（from_dict は入力をコピーするため共有できる）"""
+    return base_filing.to_dict()
@@ -20,10 +20,9 @@ class TestEdgarFiling:
         """Test EdgarCompanyFactsFiling"""
 
         def test_filing_initialize_edgar_company_facts_success(
-            self, sample_content: bytes
+            self, datetime_now: datetime, sample_content: bytes
         ) -> None:
             """EdgarCompanyFactsFiling 正常に初期化できる"""
-            datetime_now = datetime.now()
             f = EdgarCompanyFactsFiling(
                 id="facts_id",
                 checksum=sha256_checksum(sample_content),
@@ -9,8 +9,7 @@ from fino_filing.filing.filing_edinet import EDINETFiling
 @pytest.mark.filing
 @pytest.mark.edinet
 class TestFiling_Initialize_EDINET:
-    def test_filing_initialize_edinet_success(self) -> None:
-        datetime_now = datetime.now()
+    def test_filing_initialize_edinet_success(self, datetime_now: datetime) -> None:
         edinet_filing = EDINETFiling(
             id="test_id",
             checksum="test_checksum",
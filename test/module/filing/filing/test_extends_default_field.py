@@ -34,6 +34,18 @@ class ImmutableDefaultFieldMutableOverrideFiling(ImmutableDefaultFieldFiling):
     checksum = "override_checksum"
 
 
+def _define_immutable_default_override_filing() -> type[Filing]:
+    """immutable な default 値を複数上書きする子クラスを定義する（定義時に FilingImmutableError）"""
+
+    class ImmutableDefaultFieldOverrideFiling(ImmutableDefaultFieldFiling):
+        checksum = "override_checksum"
+        source = "override_source"
+        additional_field = "override_additional_field"
+        additional_field_2 = 987
+
+    return ImmutableDefaultFieldOverrideFiling
+
+
 @pytest.mark.module
 @pytest.mark.filing
 class TestExtendFiling_Initialize_ImmutableDefaultFieldOverride:
@@ -81,12 +93,7 @@ class TestExtendFiling_Initialize_ImmutableDefaultFieldOverride:
         """親クラスのimmutableなDefault値は子クラスのdefault値の設定を許容しない（複数）"""
         # クラス定義時にエラーが発生することを確認
         with pytest.raises(FilingImmutableError) as fve:
-
-            class ImmutableDefaultFieldOverrideFiling(ImmutableDefaultFieldFiling):
-                checksum = "override_checksum"
-                source = "override_source"
-                additional_field = "override_additional_field"
-                additional_field_2 = 987
+            _define_immutable_default_override_filing()
 
         # 最初に検出されたフィールドがエラーに含まれる
         assert fve.value.fields == [
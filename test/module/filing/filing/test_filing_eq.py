@@ -1,13 +1,42 @@
 """Filing の __eq__（等価判定）のテスト"""
 
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
 import pytest
 
 from fino_filing import Filing
 from fino_filing.filing.field import Field
 
+# conftest の base_filing と同じフィールド値（created_at 以外）
+_BASE_FIELDS: dict[str, Any] = {
+    "id": "test_id",
+    "source": "test_source",
+    "checksum": "test_checksum",
+    "name": "test_name",
+    "is_zip": True,
+    "format": "zip",
+}
+
+
+class ExtraFieldFiling(Filing):
+    extra: Annotated[str, Field(description="Extra")]
+
+
+class SourceDefaultFiling(Filing):
+    source = "test_source"
+
+
+class DefaultFieldFiling(Filing):
+    checksum = "c"
+
+
+def _make_filing(
+    created_at: datetime, filing_class: type[Filing] = Filing, **overrides: Any
+) -> Filing:
+    """基準のフィールド値に overrides を上書きした Filing を生成する"""
+    return filing_class(**{**_BASE_FIELDS, "created_at": created_at, **overrides})
+
 
 @pytest.mark.module
 @pytest.mark.filing
@@ -27,95 +56,33 @@ class TestFiling_Eq:
 
     """
 
-    def test_eq_same_class_instance(self, datetime_now: datetime) -> None:
+    def test_eq_same_class_instance(self, base_filing: Filing) -> None:
         """同一クラスのインスタンス同士の比較で等しい"""
-        a = Filing(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
-        b = Filing(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
-        assert a == b
-        assert b == a
+        other = _make_filing(base_filing.created_at)
+        assert base_filing == other
+        assert other == base_filing
 
-    def test_eq_same_class_same_data(self, datetime_now: datetime) -> None:
+    def test_eq_same_class_same_data(
+        self, base_filing: Filing, canonical_dict: dict[str, Any]
+    ) -> None:
         """同一クラス・同一データのとき等しい"""
-        a = Filing(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
-        b = Filing.from_dict(a.to_dict())
-        assert a == b
-        assert b == a
+        restored = Filing.from_dict(canonical_dict)
+        assert base_filing == restored
+        assert restored == base_filing
 
-    def test_eq_same_class_different_data(self, datetime_now: datetime) -> None:
+    def test_eq_same_class_different_data(self, base_filing: Filing) -> None:
         """同一クラス・異なるデータのとき等しくない"""
-        a = Filing(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
-        b = Filing(
-            id="id2",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
-        assert a != b
-        assert b != a
+        other = _make_filing(base_filing.created_at, id="id2")
+        assert base_filing != other
+        assert other != base_filing
 
     def test_eq_same_class_same_data_with_additional_field(
         self, datetime_now: datetime
     ) -> None:
         """同一クラス・同一データで追加フィールドが同一値なら等しい"""
 
-        class ExtendedFiling(Filing):
-            extra: Annotated[str, Field(description="Extra")]
-
-        a = ExtendedFiling(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-            extra="x",
-        )
-        b = ExtendedFiling(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-            extra="x",
-        )
+        a = _make_filing(datetime_now, ExtraFieldFiling, extra="x")
+        b = _make_filing(datetime_now, ExtraFieldFiling, extra="x")
         assert a == b
         assert b == a
 
@@ -124,64 +91,22 @@ class TestFiling_Eq:
     ) -> None:
         """同一クラス・同一データで追加フィールドが異なる値なら等しくない"""
 
-        class ExtendedFiling(Filing):
-            extra: Annotated[str, Field(description="Extra")]
-
-        a = ExtendedFiling(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-            extra="x",
-        )
-        b = ExtendedFiling(
-            id="id1",
-            source="src",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-            extra="y",
-        )
+        a = _make_filing(datetime_now, ExtraFieldFiling, extra="x")
+        b = _make_filing(datetime_now, ExtraFieldFiling, extra="y")
         assert a != b
         assert b != a
 
     def test_eq_different_class_not_equal(self, datetime_now: datetime) -> None:
         """異なるクラスなら共通フィールドが同じでも等しくない"""
 
-        class ExtendedFiling(Filing):
-            source = "test_source"
-
-        base = Filing(
-            id="id1",
-            source="test_source",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
-        extended = ExtendedFiling(
-            id="id1",
-            checksum="c",
-            name="n",
-            is_zip=False,
-            format="xbrl",
-            created_at=datetime_now,
-        )
+        base = _make_filing(datetime_now)
+        extended = _make_filing(datetime_now, SourceDefaultFiling)
         assert base != extended
         assert extended != base
 
     def test_eq_default_field_filing(self, datetime_now: datetime) -> None:
         """default フィールドを保持するFiling同士の比較で等しい"""
 
-        class DefaultFieldFiling(Filing):
-            checksum = "c"
-
         a = DefaultFieldFiling(
             id="id1",
             source="src",
@@ -206,9 +131,6 @@ class TestFiling_Eq:
     ) -> None:
         """default フィールドを保持するFiling同士の比較で異なる値なら等しくない"""
 
-        class DefaultFieldFiling(Filing):
-            checksum = "c"
-
         a = DefaultFieldFiling(
             id="id1",
             source="src",
@@ -33,47 +33,26 @@ class TestFiling_Field:
         assert filing.is_zip is True
         assert filing.created_at == datetime_now
 
-    def test_filing_field_attribute_correctness(self, datetime_now: datetime) -> None:
+    @pytest.mark.parametrize(
+        ("field_name", "indexed", "immutable", "description"),
+        [
+            ("id", True, True, "Filing ID"),
+            ("source", True, True, "Data source"),
+            ("checksum", True, False, "SHA256 checksum"),
+            ("name", True, True, "File name"),
+            ("is_zip", True, False, "ZIP flag"),
+            ("created_at", True, True, "Created timestamp"),
+        ],
+    )
+    def test_filing_field_attribute_correctness(
+        self, field_name: str, indexed: bool, immutable: bool, description: str
+    ) -> None:
         """Filingのフィールドがdescriptorとして正しく設定されていることを確認"""
-        # クラス属性として Field を取得
-        id_field = Filing.id
-        assert isinstance(id_field, Field)
-        assert id_field.name == "id"
-        assert id_field.indexed is True
-        assert id_field.immutable is True
-        assert id_field.description == "Filing ID"
-
-        source_field = Filing.source
-        assert isinstance(source_field, Field)
-        assert source_field.name == "source"
-        assert source_field.indexed is True
-        assert source_field.immutable is True
-        assert source_field.description == "Data source"
-
-        checksum_field = Filing.checksum
-        assert isinstance(checksum_field, Field)
-        assert checksum_field.name == "checksum"
-        assert checksum_field.indexed is True
-        assert checksum_field.immutable is False
-        assert checksum_field.description == "SHA256 checksum"
-
-        name_field = Filing.name
-        assert isinstance(name_field, Field)
-        assert name_field.name == "name"
-        assert name_field.indexed is True
-        assert name_field.immutable is True
-        assert name_field.description == "File name"
-
-        is_zip_field = Filing.is_zip
-        assert isinstance(is_zip_field, Field)
-        assert is_zip_field.name == "is_zip"
-        assert is_zip_field.indexed is True
-        assert is_zip_field.immutable is False
-        assert is_zip_field.description == "ZIP flag"
-
-        created_at_field = Filing.created_at
-        assert isinstance(created_at_field, Field)
-        assert created_at_field.name == "created_at"
-        assert created_at_field.indexed is True
-        assert created_at_field.immutable is True
-        assert created_at_field.description == "Created timestamp"
+        # クラス属性として Field を 1 度だけ取得し、以降はその参照で検証する
+        field = getattr(Filing, field_name)
+
+        assert isinstance(field, Field)
+        assert field.name == field_name
+        assert field.indexed is indexed
+        assert field.immutable is immutable
+        assert field.description == description
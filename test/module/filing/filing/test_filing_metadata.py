@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Annotated
 
 import pytest
@@ -123,6 +123,147 @@ class TestFiling_GetIndexedFields:
         # 基本Filingと同じ7つのフィールド
         assert len(indexed_fields) == 7
 
+    def test_get_indexed_fields_returns_independent_copy(self) -> None:
+        """クラス定義時に算出した一覧を返し、戻り値を変更してもクラス側の一覧は変わらない"""
+
+        class ExtendedFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+
+        assert ExtendedFiling._indexed_fields[-1] == "ticker"
+
+        indexed_fields = ExtendedFiling.get_indexed_fields()
+        indexed_fields.append("mutated")
+
+        assert ExtendedFiling.get_indexed_fields() == list(
+            ExtendedFiling._indexed_fields
+        )
+        assert "mutated" not in ExtendedFiling.get_indexed_fields()
+
+
+@pytest.mark.module
+@pytest.mark.filing
+class TestFiling_ValidationPlan:
+    """
+    FilingMeta が算出する _validation_plan のテスト
+    - 正常系: 全フィールドについて (名前, Field, 型, required, core field か) をクラス定義時に保持する
+    """
+
+    def test_validation_plan_extended_filing(self) -> None:
+        """継承Filingの追加フィールドは core field ではなく、型は Annotated、required は Field の指定に従う"""
+
+        class ExtendedFiling(Filing):
+            ticker: Annotated[str, Field(required=True, description="Ticker")]
+
+        plan = {name: rest for name, *rest in ExtendedFiling._validation_plan}
+
+        assert list(plan) == list(ExtendedFiling._fields)
+        assert plan["ticker"] == [ExtendedFiling._fields["ticker"], str, True, False]
+        assert plan["checksum"] == [Filing._fields["checksum"], str, True, True]
+
+
+@pytest.mark.module
+@pytest.mark.filing
+class TestFiling_ImmutableFields:
+    """
+    FilingMeta が算出する _immutable_fields のテスト
+    - 正常系: immutable=True のフィールド名のみを親クラス分も含めて保持する
+    - 正常系: default を持つ immutable フィールド名を _immutable_defaults に保持する
+    """
+
+    def test_immutable_fields_extended_filing(self) -> None:
+        """追加した immutable フィールドが含まれ、mutable なフィールドは含まれない"""
+
+        class ExtendedFiling(Filing):
+            ticker: Annotated[str, Field(immutable=True, description="Ticker")]
+            revenue: Annotated[float, Field(description="Revenue")]
+
+        assert ExtendedFiling._immutable_fields == {
+            "id",
+            "source",
+            "name",
+            "format",
+            "created_at",
+            "ticker",
+        }
+
+    def test_immutable_defaults_extended_filing(self) -> None:
+        """default を持つ immutable フィールドのみ _immutable_defaults に含まれる"""
+
+        class ExtendedFiling(Filing):
+            ticker: Annotated[str, Field(immutable=True, description="Ticker")]
+            market: Annotated[str, Field(immutable=True, description="Market")] = "TSE"
+            revenue: Annotated[float, Field(description="Revenue")] = 0.0
+
+        assert Filing._immutable_defaults == frozenset()
+        assert ExtendedFiling._immutable_defaults == {"market"}
+
+
+@pytest.mark.module
+@pytest.mark.filing
+class TestFiling_AnnotationHints:
+    """
+    FilingMeta が保存する _annotation_hints のテスト
+    - 正常系: クラス自身が宣言した型ヒントのみを解決して保持し、親クラスの分は再解決しない
+    """
+
+    def test_annotation_hints_extended_filing(self) -> None:
+        """継承Filingは追加フィールドの型ヒントのみを持ち、親の Field はそのまま引き継ぐ"""
+
+        class ExtendedFiling(Filing):
+            ticker: Annotated[str, Field(indexed=True, description="Ticker")]
+
+        assert list(ExtendedFiling._annotation_hints) == ["ticker"]
+        assert "checksum" in Filing._annotation_hints
+        assert ExtendedFiling._fields["checksum"] is Filing._fields["checksum"]
+        assert ExtendedFiling._fields["ticker"]._field_type is str
+
+
+@pytest.mark.module
+@pytest.mark.filing
+class TestFiling_IdentifierFields:
+    """
+    FilingMeta が算出する _identifier_fields のテスト
+    - 正常系: identifier=True のフィールド名を親クラス分も含めてソート済みで保持する
+    """
+
+    def test_identifier_fields_extended_filing(self) -> None:
+        """追加した identifier フィールドがソート位置に含まれ、それ以外は含まれない"""
+
+        class ExtendedFiling(Filing):
+            ticker: Annotated[str, Field(identifier=True, description="Ticker")]
+            revenue: Annotated[float, Field(description="Revenue")]
+
+        assert Filing._identifier_fields == ("format", "is_zip", "name", "source")
+        assert ExtendedFiling._identifier_fields == (
+            "format",
+            "is_zip",
+            "name",
+            "source",
+            "ticker",
+        )
+
+
+@pytest.mark.module
+@pytest.mark.filing
+class TestFiling_TemporalFields:
+    """
+    FilingMeta が算出する _temporal_fields のテスト
+    - 正常系: datetime / date 型のフィールドのみを (名前, 型) として親クラス分も含めて保持する
+    """
+
+    def test_temporal_fields_extended_filing(self) -> None:
+        """追加した date 型フィールドが含まれ、それ以外の型のフィールドは含まれない"""
+
+        class ExtendedFiling(Filing):
+            period_end: Annotated[date, Field(description="Period End")]
+            revenue: Annotated[float, Field(description="Revenue")]
+
+        assert Filing._temporal_fields == (("created_at", datetime),)
+        assert ExtendedFiling._temporal_fields == (
+            ("created_at", datetime),
+            ("period_end", date),
+        )
+
 
 @pytest.mark.module
 @pytest.mark.filing
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import pytest
 
@@ -44,6 +44,6 @@ class TestFiling_GenerateId:
         assert common_id == diff_checksum_id
 
         diff_created_at_id = Filing._generate_id(
-            self.common | {"created_at": datetime.now() + timedelta(seconds=1)}
+            self.common | {"created_at": datetime(2024, 1, 1)}
         )
         assert common_id == diff_created_at_id
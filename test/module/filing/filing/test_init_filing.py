@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Annotated
 
 import pytest
@@ -128,7 +128,9 @@ class TestFiling_Initialize:
             )
         assert fve.value.fields == ["name", "is_zip", "created_at"]
 
-    def test_filing_init_with_core_field_empty_failed(self) -> None:
+    def test_filing_init_with_core_field_empty_failed(
+        self, datetime_now: datetime
+    ) -> None:
         with pytest.raises(FilingValidationError) as fve:
             Filing(
                 id="",
@@ -137,7 +139,7 @@ class TestFiling_Initialize:
                 name="",
                 is_zip=True,
                 format="",
-                created_at=datetime.now(),
+                created_at=datetime_now,
             )
         assert fve.value.fields == ["id", "source", "checksum", "name", "format"]
 
@@ -189,5 +191,5 @@ class TestFiling_Initialize_ImmutableField:
         assert fva.value.field == "name"
 
         with pytest.raises(FieldImmutableError) as fva:
-            f.created_at = datetime.now()
+            f.created_at = generated_created_at + timedelta(seconds=1)
         assert fva.value.field == "created_at"
@@ -38,7 +38,7 @@ class TestFiling_Initialize_ExplicitNone:
         assert "name" in fve.value.fields
 
     def test_filing_init_with_explicit_none_for_multiple_required_fields_failed(
-        self,
+        self, datetime_now: datetime
     ) -> None:
         """複数の必須フィールドに明示的にNoneを渡した場合はエラー（id は None 時は内部生成）"""
         with pytest.raises(FilingRequiredError) as fve:
@@ -49,12 +49,14 @@ class TestFiling_Initialize_ExplicitNone:
                 name=None,  # type: ignore
                 is_zip=True,
                 format="zip",
-                created_at=datetime.now(),
+                created_at=datetime_now,
             )
         assert "source" in fve.value.fields
         assert "name" in fve.value.fields
 
-    def test_filing_init_with_explicit_none_for_default_field_success(self) -> None:
+    def test_filing_init_with_explicit_none_for_default_field_success(
+        self, datetime_now: datetime
+    ) -> None:
         """default値を持つフィールドに明示的にNoneを渡した場合"""
         from typing import Annotated
 
@@ -65,8 +67,6 @@ class TestFiling_Initialize_ExplicitNone:
                 "default_value"
             )
 
-        datetime_now = datetime.now()
-
         # default値を持つフィールドに明示的にNoneを渡す
         filing = DefaultFieldFiling(
             id="test_id",
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Iterator
@@ -15,16 +14,14 @@ from fino_filing.util.content import sha256_checksum
 
 
 @pytest.fixture
-def desk_collection() -> Iterator[Collection]:
+def desk_collection(tmp_path: Path) -> Iterator[Collection]:
     r = FilingResolver()
     r.register(ScenarioDeskFiling)
-    with tempfile.TemporaryDirectory(prefix="scenario_desk_") as tmpdir:
-        base = Path(tmpdir)
-        catalog = Catalog(str(base / "index.db"), resolver=r)
-        storage = LocalStorage(base / "storage")
-        collection = Collection(storage=storage, catalog=catalog)
-        yield collection
-        catalog.close()
+    catalog = Catalog(":memory:", resolver=r)
+    storage = LocalStorage(tmp_path / "storage")
+    collection = Collection(storage=storage, catalog=catalog)
+    yield collection
+    catalog.close()
 
 
 @pytest.mark.scenario
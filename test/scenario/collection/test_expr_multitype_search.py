@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Iterator
@@ -33,14 +32,12 @@ def _multitype_resolver() -> FilingResolver:
 
 
 @pytest.fixture
-def multitype_collection() -> Iterator[Collection]:
-    with tempfile.TemporaryDirectory(prefix="scenario_expr_") as tmpdir:
-        base = Path(tmpdir)
-        catalog = Catalog(str(base / "index.db"), resolver=_multitype_resolver())
-        storage = LocalStorage(base / "storage")
-        collection = Collection(storage=storage, catalog=catalog)
-        yield collection
-        catalog.close()
+def multitype_collection(tmp_path: Path) -> Iterator[Collection]:
+    catalog = Catalog(":memory:", resolver=_multitype_resolver())
+    storage = LocalStorage(tmp_path / "storage")
+    collection = Collection(storage=storage, catalog=catalog)
+    yield collection
+    catalog.close()
 
 
 @pytest.mark.scenario
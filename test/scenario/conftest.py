@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 from typing import Iterator
 
@@ -12,13 +11,10 @@ from fino_filing import Catalog, Collection, LocalStorage
 
 
 @pytest.fixture
-def temp_collection_pair() -> Iterator[tuple[Collection, Path]]:
-    """Temporary Collection with storage root path (for collector scenarios)."""
-    with tempfile.TemporaryDirectory(prefix="scenario_collector_") as tmpdir:
-        base = Path(tmpdir)
-        storage = LocalStorage(base / "storage")
-        catalog_path = base / "index.db"
-        catalog = Catalog(str(catalog_path))
-        collection = Collection(storage=storage, catalog=catalog)
-        yield collection, base
-        catalog.close()
+def temp_collection_pair(tmp_path: Path) -> Iterator[tuple[Collection, Path]]:
+    """Temporary Collection (in-memory catalog) with storage root path (for collector scenarios)."""
+    storage = LocalStorage(tmp_path / "storage")
+    catalog = Catalog(":memory:")
+    collection = Collection(storage=storage, catalog=catalog)
+    yield collection, tmp_path
+    catalog.close()
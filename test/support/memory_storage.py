@@ -0,0 +1,47 @@
+"""Storage protocol のインメモリ実装（テスト専用。ディスクに書き込まない）"""
+
+from pathlib import Path
+
+from fino_filing.collection.storage import _sanitize_storage_key
+
+
+class MemoryStorage:
+    """
+    dict[相対パス, bytes] で content を保持する Storage のテストダブル。
+    storage_key の検証と返す path は LocalStorage と同じ（base_dir 配下の絶対パス）だが、ファイルは作らない。
+    """
+
+    def __init__(self, base_dir: str | Path = "/mem") -> None:
+        self.base_dir = Path(base_dir)
+        self._contents: dict[str, bytes] = {}
+
+    def _key(self, storage_key: str) -> tuple[str, Path]:
+        full_path = _sanitize_storage_key(storage_key, self.base_dir)
+        return full_path.relative_to(self.base_dir.resolve()).as_posix(), full_path
+
+    def save(
+        self,
+        content: bytes,
+        storage_key: str | None = None,
+    ) -> str:
+        if storage_key is None:
+            raise ValueError("storage_key is required (resolve path via Locator)")
+        key, full_path = self._key(storage_key)
+        self._contents[key] = content
+        return str(full_path)
+
+    def load_by_path(self, relative_path: str) -> bytes:
+        """未保存の path は LocalStorage と同じく FileNotFoundError"""
+        key, full_path = self._key(relative_path)
+        try:
+            return self._contents[key]
+        except KeyError:
+            raise FileNotFoundError(str(full_path)) from None
+
+    def delete(self, relative_path: str) -> None:
+        """存在しない・不正パスは無視する"""
+        try:
+            key, _ = self._key(relative_path)
+        except ValueError:
+            return
+        self._contents.pop(key, None)